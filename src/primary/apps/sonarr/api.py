@@ -6,11 +6,17 @@ Handles all communication with the Sonarr API
 
 import requests
 import json
-import sys
+import random
+import threading
 import time
 import datetime
-import traceback
-from typing import List, Dict, Any, Optional, Union, Callable, Set
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, wraps
+from requests.adapters import HTTPAdapter
+from urllib.parse import urlsplit
+from urllib3.util.retry import Retry
+from typing import List, Dict, Any, FrozenSet, Iterable, Optional, Union, Callable, Set
 # Correct the import path
 from src.primary.utils.logger import get_logger
 from src.primary.settings_manager import get_ssl_verify_setting
@@ -18,10 +24,259 @@ from src.primary.settings_manager import get_ssl_verify_setting
 # Get logger for the Sonarr app
 sonarr_logger = get_logger("sonarr")
 
-# Use a session for better performance
+# Prefer orjson for decoding the large paginated payloads - it parses
+# nested dict-heavy JSON several times faster than stdlib json. Fall back
+# to stdlib json when it isn't installed.
+try:
+    import orjson
+    _loads = orjson.loads
+    _dumps = orjson.dumps  # bytes
+    _JSONDecodeError = (json.JSONDecodeError, orjson.JSONDecodeError)
+except ImportError:
+    _loads = json.loads
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+    _JSONDecodeError = json.JSONDecodeError
+
+# ijson lets the streaming iterators below decode records incrementally
+# instead of buffering whole 1000-record pages
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Use a session for better performance - keep-alive means paginated fetches
+# reuse one TCP/TLS connection instead of re-handshaking per page
 session = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=8,
+    pool_maxsize=32,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.8,
+        status_forcelist=(429, 502, 503, 504),
+        allowed_methods=frozenset(["GET", "POST", "PUT", "DELETE"]),
+        respect_retry_after_header=True,
+        raise_on_status=False
+    )
+)
+session.mount("http://", _adapter)
+session.mount("https://", _adapter)
+
+# Ask for compressed JSON explicitly; multi-MB wanted/episode payloads
+# shrink several-fold on the wire. Advertise brotli only when a decoder is
+# importable so we never receive bytes urllib3 cannot decompress.
+try:
+    import brotli  # noqa: F401 - presence check only
+    _ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:
+    _ACCEPT_ENCODING = "gzip, deflate"
+session.headers.update({
+    "Accept-Encoding": _ACCEPT_ENCODING,
+    "Accept": "application/json"
+})
+
+# Dedicated RNG instance for page/record selection - avoids repeated
+# module-dict lookups on the global random functions in hot paths
+_rng = random.Random()
+
+@lru_cache(maxsize=8)
+def _base_for(api_url: str) -> str:
+    """Base URL with any trailing slash removed, cached per instance."""
+    return api_url.rstrip('/')
+
+@lru_cache(maxsize=8)
+def _auth_headers(api_key: str) -> Dict[str, str]:
+    """Reusable X-Api-Key header dict, built once per key."""
+    return {"X-Api-Key": api_key}
+
+@lru_cache(maxsize=8)
+def _has_valid_scheme(api_url: str) -> bool:
+    """Cached per-instance check that the URL carries an http(s) scheme."""
+    return urlsplit(api_url).scheme in ("http", "https")
+
+# The SSL verify setting is read from the settings store on every request;
+# cache it briefly so paginated fetches don't re-parse settings per page
+_SSL_VERIFY_TTL = 30  # seconds
+_ssl_verify_cache = None  # (value, fetched_at)
+
+# Lazily bound once to avoid re-running the import machinery per request
+_increment_hourly_cap = None
+
+# Per-(api_url, api_key) request context so every call doesn't re-strip the
+# base URL and rebuild the same three-entry header dict
+_CTX_CACHE: Dict[tuple, tuple] = {}
+
+# Method dispatch for arr_request - bound session methods, looked up once
+_METHOD_FUNCS = {
+    "GET": session.get,
+    "POST": session.post,
+    "PUT": session.put,
+    "DELETE": session.delete
+}
+
+# Tag labels and tag/series membership change rarely; cache them briefly so
+# the per-cycle gating lookups become dict hits instead of full-list scans
+_TAG_CACHE: Dict[str, tuple] = {}          # api_url -> (fetched_at, {normalized_label: id})
+_SERIES_LIST_CACHE: Dict[str, tuple] = {}  # api_url -> (fetched_at, series_list)
+_SERIES_BY_ID_CACHE: Dict[tuple, tuple] = {}  # (api_url, series_id) -> (fetched_at, series)
+_METADATA_CACHE_TTL = 60  # seconds
+
+# Quality profiles effectively never change mid-run; give them a longer TTL
+_QUALITY_PROFILES_CACHE: Dict[str, tuple] = {}  # api_url -> (fetched_at, profiles)
+_QUALITY_PROFILES_TTL = 300  # seconds
+
+def _invalidate_metadata_caches(api_url: str) -> None:
+    """Drop cached tag/series data after a write that may have changed them."""
+    _TAG_CACHE.pop(api_url, None)
+    _SERIES_LIST_CACHE.pop(api_url, None)
+    for key in [k for k in _SERIES_BY_ID_CACHE if k[0] == api_url]:
+        _SERIES_BY_ID_CACHE.pop(key, None)
+    # Conditional-request entries for tag/series GETs are stale too: after a
+    # write, a 304 replay of the old body would hide the change (or any
+    # caller-side edit to it) until the server's ETag rolls over
+    prefixes = (f"{_base_for(api_url)}/api/v3/tag", f"{_base_for(api_url)}/api/v3/series")
+    for key in [k for k in _ETAG_CACHE if k[0].startswith(prefixes)]:
+        _ETAG_CACHE.pop(key, None)
+
+# totalRecords probes for the random-page helpers. The count drifts slowly,
+# so a fresh cached value lets us skip the pageSize=1 round-trip that
+# otherwise doubles every random-page call.
+_TOTAL_RECORDS_CACHE: Dict[tuple, tuple] = {}  # (api_url, endpoint, monitored_only) -> (fetched_at, total)
+_TOTAL_RECORDS_TTL = 45  # seconds
+
+def _invalidate_total_records(api_url: str) -> None:
+    """Drop cached totalRecords counts after a search that may change them."""
+    for key in [k for k in _TOTAL_RECORDS_CACHE if k[0] == api_url]:
+        _TOTAL_RECORDS_CACHE.pop(key, None)
+
+def _get_wanted_total_records(api_url: str, api_key: str, api_timeout: int,
+                              endpoint: str, monitored_only: bool) -> Optional[int]:
+    """Return totalRecords for a wanted/* endpoint, probing with pageSize=1 on cache miss."""
+    cache_key = (api_url, endpoint, monitored_only)
+    cached = _TOTAL_RECORDS_CACHE.get(cache_key)
+    now = time.monotonic()
+    if cached and now - cached[0] < _TOTAL_RECORDS_TTL:
+        return cached[1]
 
-def arr_request(api_url: str, api_key: str, api_timeout: int, endpoint: str, method: str = "GET", data: Dict = None, count_api: bool = True) -> Any:
+    params = {
+        "page": 1,
+        "pageSize": 1,
+        "includeSeries": "true",
+        "monitored": monitored_only
+    }
+    url = f"{_base_for(api_url)}/api/v3/{endpoint}"
+    response = session.get(url, headers=_auth_headers(api_key), params=params, timeout=api_timeout)
+    response.raise_for_status()
+    if not response.content:
+        return None
+
+    total_records = _loads(response.content).get('totalRecords', 0)
+    _TOTAL_RECORDS_CACHE[cache_key] = (now, total_records)
+    return total_records
+
+def _request_context(api_url: str, api_key: str) -> tuple:
+    """Return (base_url, headers) for an instance, cached across calls."""
+    ctx = _CTX_CACHE.get((api_url, api_key))
+    if ctx is None:
+        headers = {
+            "X-Api-Key": api_key,
+            "Content-Type": "application/json",
+            "User-Agent": "Huntarr/1.0 (https://github.com/plexguide/Huntarr.io)"
+        }
+        ctx = (_base_for(api_url), headers)
+        _CTX_CACHE[(api_url, api_key)] = ctx
+    return ctx
+
+def _cached_ssl_verify() -> bool:
+    """Return the SSL verification setting, re-reading it at most every _SSL_VERIFY_TTL seconds."""
+    global _ssl_verify_cache
+    now = time.monotonic()
+    if _ssl_verify_cache is None or now - _ssl_verify_cache[1] > _SSL_VERIFY_TTL:
+        _ssl_verify_cache = (get_ssl_verify_setting(), now)
+    return _ssl_verify_cache[0]
+
+# Conditional-request cache for idempotent GETs: Sonarr sends ETag
+# headers, so revalidating with If-None-Match turns an unchanged payload
+# into a bodyless 304 and we reuse the previously parsed response.
+_ETAG_CACHE: Dict[tuple, tuple] = {}
+_ETAG_CACHE_MAX = 256
+
+# Single-flight coalescing for idempotent GETs: when several worker
+# threads ask for the same URL at the same moment, one request goes out
+# and the rest wait for (and share) its parsed result.
+class _Flight:
+    __slots__ = ("event", "result")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+
+_inflight: Dict[tuple, "_Flight"] = {}
+_inflight_lock = threading.Lock()
+
+# Hourly-cap hits are batched: each one touches the stats database, so a
+# burst of paginated requests would otherwise pay one write per page.
+# Pending hits accumulate under a lock and flush at most once a second.
+_CAP_FLUSH_INTERVAL = 1.0
+_cap_lock = threading.Lock()
+_cap_pending = 0
+_cap_last_flush = 0.0
+
+# Cap checks hit the stats store; stats_manager caches the verdict briefly,
+# and that cache is shared with the hunt modules so one cycle can't see
+# divergent values
+_check_hourly_cap_exceeded = None  # resolved lazily like _increment_hourly_cap
+
+def _cap_exceeded() -> bool:
+    """Return whether the Sonarr hourly cap is exceeded (cached in stats_manager)."""
+    global _check_hourly_cap_exceeded
+    if _check_hourly_cap_exceeded is None:
+        from src.primary.stats_manager import check_hourly_cap_exceeded_cached
+        _check_hourly_cap_exceeded = check_hourly_cap_exceeded_cached
+    return _check_hourly_cap_exceeded("sonarr")
+
+def _count_api_hit(count: int = 1) -> None:
+    """Record Sonarr API calls against the hourly cap, flushing in batches."""
+    global _increment_hourly_cap, _cap_pending, _cap_last_flush
+    with _cap_lock:
+        _cap_pending += count
+        now = time.monotonic()
+        if now - _cap_last_flush < _CAP_FLUSH_INTERVAL:
+            return
+        pending = _cap_pending
+        _cap_pending = 0
+        _cap_last_flush = now
+    if _increment_hourly_cap is None:
+        from src.primary.stats_manager import increment_hourly_cap
+        _increment_hourly_cap = increment_hourly_cap
+    _increment_hourly_cap("sonarr", pending)
+
+def _sonarr_call(name: str, default: Any = None):
+    """
+    Wrap an API helper with the standard typed error handlers.
+
+    Keeps one try block per call instead of each function carrying its own
+    RequestException/decode/catch-all triplet.
+    """
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            try:
+                return fn(*args, **kwargs)
+            except requests.exceptions.RequestException as e:
+                sonarr_logger.error(f"{name}: HTTP error: {e}")
+                return default
+            except _JSONDecodeError as e:
+                sonarr_logger.error(f"{name}: failed to decode response: {e}")
+                return default
+            except Exception as e:
+                sonarr_logger.error(f"{name}: unexpected error: {e}")
+                return default
+        return wrapper
+    return decorator
+
+def arr_request(api_url: str, api_key: str, api_timeout: int, endpoint: str, method: str = "GET", data: Dict = None, params: Dict = None, count_api: bool = True) -> Any:
     """
     Make a request to the Sonarr API.
 
@@ -32,65 +287,100 @@ def arr_request(api_url: str, api_key: str, api_timeout: int, endpoint: str, met
         endpoint: The API endpoint to call
         method: HTTP method (GET, POST, PUT, DELETE)
         data: Optional data payload for POST/PUT requests
+        params: Optional query parameters, URL-encoded by requests
 
     Returns:
         The parsed JSON response or None if the request failed
     """
-    try:
-        if not api_url or not api_key:
-            sonarr_logger.error("No URL or API key provided")
-            return None
+    if not api_url or not api_key:
+        sonarr_logger.error("No URL or API key provided")
+        return None
 
-        # Ensure api_url has a scheme
-        if not (api_url.startswith('http://') or api_url.startswith('https://')):
-            sonarr_logger.error(f"Invalid URL format: {api_url} - URL must start with http:// or https://")
-            return None
+    # Ensure api_url has a scheme (parsed once per instance, then cached)
+    if not _has_valid_scheme(api_url):
+        sonarr_logger.error(f"Invalid URL format: {api_url} - URL must start with http:// or https://")
+        return None
 
-        # Construct the full URL properly
-        full_url = f"{api_url.rstrip('/')}/api/v3/{endpoint.lstrip('/')}"
+    # Construct the full URL from the cached per-instance context
+    base_url, headers = _request_context(api_url, api_key)
+    full_url = f"{base_url}/api/v3/{endpoint.lstrip('/')}"
 
-        # Set up headers with User-Agent to identify Huntarr
-        headers = {
-            "X-Api-Key": api_key,
-            "Content-Type": "application/json",
-            "User-Agent": "Huntarr/1.0 (https://github.com/plexguide/Huntarr.io)"
-        }
+    # Get SSL verification setting (cached briefly - it changes rarely)
+    verify_ssl = _cached_ssl_verify()
 
-        # Get SSL verification setting
-        verify_ssl = get_ssl_verify_setting()
+    if not verify_ssl:
+        sonarr_logger.debug("SSL verification disabled by user setting")
 
-        if not verify_ssl:
-            sonarr_logger.debug("SSL verification disabled by user setting")
+    method_upper = method.upper()
+    request_func = _METHOD_FUNCS.get(method_upper)
+    if request_func is None:
+        sonarr_logger.error(f"Unsupported HTTP method: {method}")
+        return None
 
+    # Revalidate cached GET responses with If-None-Match when we hold an ETag
+    etag_key = None
+    cached = None
+    if method_upper == "GET":
+        etag_key = (full_url, tuple(sorted(params.items())) if params else None)
+        cached = _ETAG_CACHE.get(etag_key)
+        if cached is not None:
+            headers = dict(headers)
+            headers["If-None-Match"] = cached[0]
+
+    def _execute() -> Any:
         try:
-            if method.upper() == "GET":
-                response = session.get(full_url, headers=headers, timeout=api_timeout, verify=verify_ssl)
-            elif method.upper() == "POST":
-                response = session.post(full_url, headers=headers, json=data, timeout=api_timeout, verify=verify_ssl)
-            elif method.upper() == "PUT":
-                response = session.put(full_url, headers=headers, json=data, timeout=api_timeout, verify=verify_ssl)
-            elif method.upper() == "DELETE":
-                response = session.delete(full_url, headers=headers, timeout=api_timeout, verify=verify_ssl)
-            else:
-                sonarr_logger.error(f"Unsupported HTTP method: {method}")
-                return None
+            response = request_func(
+                full_url,
+                headers=headers,
+                params=params,
+                # Pre-encode write bodies with orjson; the cached context
+                # headers already declare application/json
+                data=_dumps(data) if data is not None and method_upper in ("POST", "PUT") else None,
+                timeout=api_timeout,
+                verify=verify_ssl
+            )
 
             # Check for successful response
             response.raise_for_status()
 
+            # Writes to tag/series endpoints can change the cached metadata
+            if method_upper != "GET" and endpoint.lstrip('/').startswith(("tag", "series")):
+                _invalidate_metadata_caches(api_url)
+
             # Increment API counter only if count_api is True and request was successful
             if count_api:
                 try:
-                    from src.primary.stats_manager import increment_hourly_cap
-                    increment_hourly_cap("sonarr")
+                    _count_api_hit()
                 except Exception as e:
                     sonarr_logger.warning(f"Failed to increment API counter for sonarr: {e}")
 
+            # Not modified - reuse the parsed body we revalidated against.
+            # Read the local captured before the request went out: the dict
+            # entry may have been evicted by another thread in the meantime
+            if response.status_code == 304:
+                if cached is not None:
+                    return cached[1]
+                sonarr_logger.warning(f"Unexpected 304 from {endpoint} with no cached body to reuse")
+                return None
+
             # Check if there's any content before trying to parse JSON
             if response.content:
                 try:
-                    return response.json()
-                except json.JSONDecodeError as jde:
+                    parsed = _loads(response.content)
+                    if etag_key is not None:
+                        etag = response.headers.get("ETag")
+                        if etag:
+                            # Evict oldest entries (dicts iterate in insertion
+                            # order) rather than clearing the whole cache out
+                            # from under concurrent revalidations
+                            while len(_ETAG_CACHE) >= _ETAG_CACHE_MAX:
+                                try:
+                                    del _ETAG_CACHE[next(iter(_ETAG_CACHE))]
+                                except (StopIteration, KeyError, RuntimeError):
+                                    break
+                            _ETAG_CACHE[etag_key] = (etag, parsed)
+                    return parsed
+                except _JSONDecodeError as jde:
                     # Log detailed information about the malformed response
                     sonarr_logger.error(f"Error decoding JSON response from {endpoint}: {str(jde)}")
                     sonarr_logger.error(f"Response status code: {response.status_code}")
@@ -110,14 +400,34 @@ def arr_request(api_url: str, api_key: str, api_timeout: int, endpoint: str, met
 
             sonarr_logger.error(f"Error during {method} request to {endpoint}: {error_details}")
             return None
-    except Exception as e:
-        # Catch all exceptions and log them with traceback
-        error_msg = f"CRITICAL ERROR in arr_request: {str(e)}"
-        sonarr_logger.error(error_msg)
-        sonarr_logger.error(f"Full traceback: {traceback.format_exc()}")
-        print(error_msg, file=sys.stderr)
-        print(traceback.format_exc(), file=sys.stderr)
-        return None
+        except Exception as e:
+            # logger.exception records the traceback without the cost of
+            # formatting it eagerly or echoing it to stderr
+            sonarr_logger.exception(f"CRITICAL ERROR in arr_request: {str(e)}")
+            return None
+
+    if etag_key is None:
+        return _execute()
+
+    # Coalesce concurrent identical GETs onto a single request
+    with _inflight_lock:
+        flight = _inflight.get(etag_key)
+        leader = flight is None
+        if leader:
+            flight = _Flight()
+            _inflight[etag_key] = flight
+
+    if not leader:
+        flight.event.wait(api_timeout + 1 if api_timeout else None)
+        return flight.result
+
+    try:
+        flight.result = _execute()
+        return flight.result
+    finally:
+        with _inflight_lock:
+            _inflight.pop(etag_key, None)
+        flight.event.set()
 
 def check_connection(api_url: str, api_key: str, api_timeout: int) -> bool:
     """Checks connection by fetching system status."""
@@ -170,6 +480,39 @@ def get_series(api_url: str, api_key: str, api_timeout: int, series_id: Optional
 # NEW: tag helpers for gating missing/upgrade hunting by tag label
 # ---------------------------------------------------------------------------
 
+def _get_tag_map(api_url: str, api_key: str, api_timeout: int) -> Optional[Dict[str, int]]:
+    """Return {normalized_label: tag_id} for an instance, cached for a short TTL."""
+    cached = _TAG_CACHE.get(api_url)
+    now = time.monotonic()
+    if cached and now - cached[0] < _METADATA_CACHE_TTL:
+        return cached[1]
+
+    tags = arr_request(api_url, api_key, api_timeout, "tag", count_api=False)
+    if tags is None:
+        return None
+
+    tag_map: Dict[str, int] = {}
+    for t in tags:
+        try:
+            tag_map[(t.get("label") or "").strip().lower()] = int(t.get("id"))
+        except Exception:
+            continue
+
+    _TAG_CACHE[api_url] = (now, tag_map)
+    return tag_map
+
+def _get_series_list_cached(api_url: str, api_key: str, api_timeout: int) -> Union[List, None]:
+    """Return the full series list for an instance, cached for a short TTL."""
+    cached = _SERIES_LIST_CACHE.get(api_url)
+    now = time.monotonic()
+    if cached and now - cached[0] < _METADATA_CACHE_TTL:
+        return cached[1]
+
+    series_list = get_series(api_url, api_key, api_timeout)
+    if series_list:
+        _SERIES_LIST_CACHE[api_url] = (now, series_list)
+    return series_list
+
 def get_tag_id_by_label(api_url: str, api_key: str, api_timeout: int, tag_label: str) -> Optional[int]:
     """
     Return tag ID for a given label, or None if it doesn't exist.
@@ -178,18 +521,10 @@ def get_tag_id_by_label(api_url: str, api_key: str, api_timeout: int, tag_label:
     try:
         if not tag_label:
             return None
-        tags = arr_request(api_url, api_key, api_timeout, "tag", count_api=False)
-        if not tags:
+        tag_map = _get_tag_map(api_url, api_key, api_timeout)
+        if not tag_map:
             return None
-
-        want = tag_label.strip().lower()
-        for t in tags:
-            if (t.get("label") or "").strip().lower() == want:
-                try:
-                    return int(t.get("id"))
-                except Exception:
-                    return None
-        return None
+        return tag_map.get(tag_label.strip().lower())
     except Exception as e:
         sonarr_logger.error(f"Error getting tag id for '{tag_label}': {e}")
         return None
@@ -200,7 +535,7 @@ def get_series_ids_with_tag(api_url: str, api_key: str, api_timeout: int, tag_id
     """
     out: Set[int] = set()
     try:
-        series_list = get_series(api_url, api_key, api_timeout)
+        series_list = _get_series_list_cached(api_url, api_key, api_timeout)
         if not series_list:
             return out
 
@@ -218,6 +553,34 @@ def get_series_ids_with_tag(api_url: str, api_key: str, api_timeout: int, tag_id
         sonarr_logger.error(f"Error building series set for tag {tag_id}: {e}")
         return out
 
+# Tag-gated hunting resolves a label to its tagged-series set at the top of
+# every cycle; cache the set briefly so back-to-back cycles skip both the
+# tag and series lookups. Shared by the missing and upgrade modules.
+_TAGGED_IDS_TTL = 60  # seconds
+_tagged_ids_cache: Dict[tuple, tuple] = {}  # (api_url, tag_label) -> (fetched_at, frozenset)
+
+def get_series_ids_with_tag_label(api_url: str, api_key: str, api_timeout: int, tag_label: str) -> Optional[FrozenSet[int]]:
+    """
+    Return the frozenset of series IDs carrying tag_label, cached for _TAGGED_IDS_TTL.
+
+    Returns None when the tag does not exist. That outcome is deliberately
+    not cached: the tag may be created at any moment and should take effect
+    on the next cycle.
+    """
+    cache_key = (api_url, tag_label)
+    cached = _tagged_ids_cache.get(cache_key)
+    now = time.monotonic()
+    if cached and now - cached[0] < _TAGGED_IDS_TTL:
+        return cached[1]
+
+    tag_id = get_tag_id_by_label(api_url, api_key, api_timeout, tag_label)
+    if tag_id is None:
+        return None
+
+    allowed = frozenset(get_series_ids_with_tag(api_url, api_key, api_timeout, tag_id))
+    _tagged_ids_cache[cache_key] = (now, allowed)
+    return allowed
+
 def get_episode(api_url: str, api_key: str, api_timeout: int, episode_id: int) -> Dict:
     """Get episode information by ID."""
     response = arr_request(api_url, api_key, api_timeout, f"episode/{episode_id}", count_api=False)
@@ -234,17 +597,13 @@ def get_queue(api_url: str, api_key: str, api_timeout: int) -> List:
 
 def get_calendar(api_url: str, api_key: str, api_timeout: int, start_date: Optional[str] = None, end_date: Optional[str] = None) -> List:
     """Get calendar information for a date range."""
-    params = []
+    params = {}
     if start_date:
-        params.append(f"start={start_date}")
+        params["start"] = start_date
     if end_date:
-        params.append(f"end={end_date}")
-
-    endpoint = "calendar"
-    if params:
-        endpoint = f"{endpoint}?{'&'.join(params)}"
+        params["end"] = end_date
 
-    response = arr_request(api_url, api_key, api_timeout, endpoint, count_api=False)
+    response = arr_request(api_url, api_key, api_timeout, "calendar", params=params, count_api=False)
     if response:
         return response
     return []
@@ -256,271 +615,236 @@ def command_status(api_url: str, api_key: str, api_timeout: int, command_id: Uni
         return response
     return {}
 
-def get_missing_episodes(api_url: str, api_key: str, api_timeout: int, monitored_only: bool, series_id: Optional[int] = None) -> List[Dict[str, Any]]:
-    """Get missing episodes from Sonarr, handling pagination."""
-    endpoint = "wanted/missing"
-    page = 1
-    page_size = 1000
-    all_missing_episodes = []
-    retries_per_page = 2
-    retry_delay = 3
-
-    while True:
-        retry_count = 0
-        success = False
+def _fetch_wanted_page(url: str, api_key: str, params: Dict[str, Any], api_timeout: int, label: str,
+                       retries_per_page: int = 2, retry_delay: int = 3) -> Optional[Dict[str, Any]]:
+    """Fetch a single page of a wanted/* endpoint, retrying empty or undecodable bodies."""
+    page = params.get("page")
+    for attempt in range(retries_per_page + 1):
+        sonarr_logger.debug(f"Requesting {label} page {page} (attempt {attempt+1}/{retries_per_page+1})")
+        try:
+            response = session.get(url, headers=_auth_headers(api_key), params=params, timeout=api_timeout)
+            response.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            # Transport errors already went through the adapter's Retry policy
+            sonarr_logger.error(f"Request error for {label} page {page}: {e}")
+            return None
 
-        while retry_count <= retries_per_page and not success:
-            params = {
-                "page": page,
-                "pageSize": page_size,
-                "includeSeries": "true",
-                "monitored": monitored_only
-            }
+        if not response.content:
+            sonarr_logger.warning(f"Empty response for {label} page {page} (attempt {attempt+1})")
+            if attempt < retries_per_page:
+                time.sleep(retry_delay)
+                continue
+            sonarr_logger.error(f"Giving up on empty response after {retries_per_page+1} attempts")
+            return None
 
-            if series_id is not None:
-                params["seriesId"] = series_id
+        try:
+            return _loads(response.content)
+        except _JSONDecodeError as e:
+            sonarr_logger.error(f"Failed to decode JSON for {label} page {page} (attempt {attempt+1}): {e}")
+            if attempt < retries_per_page:
+                time.sleep(retry_delay)
+                continue
+            sonarr_logger.error(f"Giving up after {retries_per_page+1} failed JSON decode attempts")
+            return None
+    return None
 
-            base_url = api_url.rstrip('/')
-            url = f"{base_url}/api/v3/{endpoint.lstrip('/')}"
-            sonarr_logger.debug(f"Requesting missing episodes page {page} (attempt {retry_count+1}/{retries_per_page+1})")
+def _extend_filtered(dest: List[Dict[str, Any]], records: List[Dict[str, Any]], monitored_only: bool) -> None:
+    """Append records, dropping unmonitored ones inline when monitored_only is set."""
+    if monitored_only:
+        dest.extend(
+            r for r in records
+            if r.get('monitored') and (r.get('series') or {}).get('monitored')
+        )
+    else:
+        dest.extend(records)
 
-            try:
-                response = requests.get(url, headers={"X-Api-Key": api_key}, params=params, timeout=api_timeout)
-                response.raise_for_status()
+def _iter_wanted_records(api_url: str, api_key: str, api_timeout: int, endpoint: str,
+                         page_params: Callable[[int], Dict[str, Any]], monitored_only: bool, label: str):
+    """
+    Yield wanted/* records one at a time, page by page.
 
-                if not response.content:
-                    sonarr_logger.warning(f"Empty response for missing episodes page {page} (attempt {retry_count+1})")
-                    if retry_count < retries_per_page:
-                        retry_count += 1
-                        time.sleep(retry_delay)
-                        continue
-                    else:
-                        sonarr_logger.error(f"Giving up on empty response after {retries_per_page+1} attempts")
-                        break
+    Unlike the list paginators this never materializes the full result set,
+    so callers that stop early keep peak memory bounded. When ijson is
+    installed each page is decoded incrementally off the socket.
+    """
+    page_size = page_params(1).get("pageSize", 1000)
+    url = f"{_base_for(api_url)}/api/v3/{endpoint}"
+    page = 1
 
-                try:
-                    data = response.json()
-                    records = data.get('records', [])
-                    total_records_on_page = len(records)
-                    sonarr_logger.debug(f"Parsed {total_records_on_page} missing episode records from page {page}")
-
-                    if not records:
-                        sonarr_logger.debug(f"No more records found on page {page}. Stopping pagination.")
-                        success = True
-                        break
-
-                    all_missing_episodes.extend(records)
-
-                    if total_records_on_page < page_size:
-                        sonarr_logger.debug(f"Received {total_records_on_page} records (less than page size {page_size}). Last page.")
-                        success = True
-                        break
-
-                    success = True
-                    break
-
-                except json.JSONDecodeError as e:
-                    sonarr_logger.error(f"Failed to decode JSON response for missing episodes page {page} (attempt {retry_count+1}): {e}")
-                    if retry_count < retries_per_page:
-                        retry_count += 1
-                        time.sleep(retry_delay)
-                        continue
-                    else:
-                        sonarr_logger.error(f"Giving up after {retries_per_page+1} failed JSON decode attempts")
-                        break
+    while True:
+        params = page_params(page)
+        records_on_page = 0
 
+        if ijson is not None:
+            try:
+                response = session.get(url, headers=_auth_headers(api_key), params=params,
+                                       timeout=api_timeout, stream=True)
+                response.raise_for_status()
             except requests.exceptions.RequestException as e:
-                sonarr_logger.error(f"Request error for missing episodes page {page} (attempt {retry_count+1}): {e}")
-                if retry_count < retries_per_page:
-                    retry_count += 1
-                    time.sleep(retry_delay)
-                    continue
-                else:
-                    sonarr_logger.error(f"Giving up on request after {retries_per_page+1} failed attempts")
-                    break
+                sonarr_logger.error(f"Request error streaming {label} page {page}: {e}")
+                return
+            try:
+                with response:
+                    # Let urllib3 decompress before ijson sees the bytes
+                    response.raw.decode_content = True
+                    for rec in ijson.items(response.raw, 'records.item'):
+                        records_on_page += 1
+                        if monitored_only and not (rec.get('monitored') and (rec.get('series') or {}).get('monitored')):
+                            continue
+                        yield rec
             except Exception as e:
-                sonarr_logger.error(f"Unexpected error for missing episodes page {page} (attempt {retry_count+1}): {e}")
-                if retry_count < retries_per_page:
-                    retry_count += 1
-                    time.sleep(retry_delay)
+                sonarr_logger.error(f"Error streaming {label} page {page}: {e}")
+                return
+        else:
+            data = _fetch_wanted_page(url, api_key, params, api_timeout, label)
+            if not data:
+                return
+            records = data.get('records', [])
+            records_on_page = len(records)
+            for rec in records:
+                if monitored_only and not (rec.get('monitored') and (rec.get('series') or {}).get('monitored')):
                     continue
-                else:
-                    sonarr_logger.error(f"Giving up after unexpected error and {retries_per_page+1} attempts")
-                    break
-
-        if not success or not records:
-            break
+                yield rec
 
+        if records_on_page < page_size:
+            return
         page += 1
 
-    sonarr_logger.info(f"Total missing episodes fetched across all pages: {len(all_missing_episodes)}")
+def iter_missing_episodes(api_url: str, api_key: str, api_timeout: int, monitored_only: bool,
+                          series_id: Optional[int] = None):
+    """Stream missing episodes incrementally; see _iter_wanted_records."""
+    def page_params(page: int) -> Dict[str, Any]:
+        params = {
+            "page": page,
+            "pageSize": 1000,
+            "includeSeries": "true",
+            "monitored": monitored_only
+        }
+        if series_id is not None:
+            params["seriesId"] = series_id
+        return params
+
+    return _iter_wanted_records(api_url, api_key, api_timeout, "wanted/missing",
+                                page_params, monitored_only, "missing episodes")
+
+def iter_cutoff_unmet_episodes(api_url: str, api_key: str, api_timeout: int, monitored_only: bool):
+    """Stream cutoff unmet episodes incrementally; see _iter_wanted_records."""
+    def page_params(page: int) -> Dict[str, Any]:
+        return {
+            "page": page,
+            "pageSize": 1000,
+            "includeSeries": "true",
+            "sortKey": "airDateUtc",
+            "sortDir": "asc",
+            "monitored": monitored_only
+        }
 
-    if monitored_only:
-        original_count = len(all_missing_episodes)
-        filtered_missing = [
-            ep for ep in all_missing_episodes
-            if ep.get('series', {}).get('monitored', False) and ep.get('monitored', False)
-        ]
-        sonarr_logger.debug(f"Filtered for monitored_only=True: {len(filtered_missing)} monitored episodes (out of {original_count} total)")
-        return filtered_missing
-    else:
-        sonarr_logger.debug(f"Returning {len(all_missing_episodes)} episodes (monitored_only=False)")
-        return all_missing_episodes
+    return _iter_wanted_records(api_url, api_key, api_timeout, "wanted/cutoff",
+                                page_params, monitored_only, "cutoff unmet")
 
-def get_cutoff_unmet_episodes(api_url: str, api_key: str, api_timeout: int, monitored_only: bool) -> List[Dict[str, Any]]:
-    """Get cutoff unmet episodes from Sonarr, handling pagination."""
-    endpoint = "wanted/cutoff"
-    page = 1
+def get_missing_episodes(api_url: str, api_key: str, api_timeout: int, monitored_only: bool, series_id: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Get missing episodes from Sonarr, handling pagination."""
     page_size = 1000
-    all_cutoff_unmet = []
-    retries_per_page = 2
-    retry_delay = 3
-
-    sonarr_logger.debug(f"Starting fetch for cutoff unmet episodes (monitored_only={monitored_only}).")
+    all_missing_episodes = []
 
-    while True:
-        retry_count = 0
-        success = False
-        records = []
-
-        while retry_count <= retries_per_page and not success:
-            params = {
-                "page": page,
-                "pageSize": page_size,
-                "includeSeries": "true",
-                "sortKey": "airDateUtc",
-                "sortDir": "asc",
-                "monitored": monitored_only
-            }
-            url = f"{api_url}/api/v3/{endpoint}"
-            sonarr_logger.debug(f"Requesting cutoff unmet page {page} (attempt {retry_count+1}/{retries_per_page+1})")
+    url = f"{_base_for(api_url)}/api/v3/wanted/missing"
 
-            try:
-                response = requests.get(url, headers={"X-Api-Key": api_key}, params=params, timeout=api_timeout)
-                sonarr_logger.debug(f"Sonarr API response status code for cutoff unmet page {page}: {response.status_code}")
-                response.raise_for_status()
+    def page_params(page: int) -> Dict[str, Any]:
+        params = {
+            "page": page,
+            "pageSize": page_size,
+            "includeSeries": "true",
+            "monitored": monitored_only
+        }
+        if series_id is not None:
+            params["seriesId"] = series_id
+        return params
 
-                if not response.content:
-                    sonarr_logger.warning(f"Empty response for cutoff unmet episodes page {page} (attempt {retry_count+1})")
-                    if retry_count < retries_per_page:
-                        retry_count += 1
-                        time.sleep(retry_delay)
-                        continue
-                    else:
-                        sonarr_logger.error(f"Giving up on empty response after {retries_per_page+1} attempts")
-                        break
+    data = _fetch_wanted_page(url, api_key, page_params(1), api_timeout, "missing episodes")
+    if data:
+        records = data.get('records', [])
+        _extend_filtered(all_missing_episodes, records, monitored_only)
 
-                try:
-                    data = response.json()
-                    records = data.get('records', [])
-                    total_records_on_page = len(records)
-                    total_records_reported = data.get('totalRecords', 0)
-
-                    if page == 1:
-                        sonarr_logger.info(f"Sonarr API reports {total_records_reported} total cutoff unmet records.")
-
-                    sonarr_logger.debug(f"Parsed {total_records_on_page} cutoff unmet records from page {page}")
-
-                    if not records:
-                        sonarr_logger.debug(f"No more cutoff unmet records found on page {page}. Stopping pagination.")
-                        success = True
-                        break
-
-                    all_cutoff_unmet.extend(records)
-
-                    if total_records_on_page < page_size:
-                        sonarr_logger.debug(f"Received {total_records_on_page} records (less than page size {page_size}). Last page.")
-                        success = True
-                        break
-
-                    success = True
-                    break
-
-                except json.JSONDecodeError as e:
-                    sonarr_logger.error(f"Failed to decode JSON for cutoff unmet page {page} (attempt {retry_count+1}): {e}")
-                    if retry_count < retries_per_page:
-                        retry_count += 1
-                        time.sleep(retry_delay)
-                        continue
-                    else:
-                        sonarr_logger.error(f"Giving up after {retries_per_page+1} failed JSON decode attempts")
-                        break
-
-            except requests.exceptions.Timeout as e:
-                sonarr_logger.error(f"Timeout for cutoff unmet page {page} (attempt {retry_count+1}): {e}")
-                if retry_count < retries_per_page:
-                    retry_count += 1
-                    time.sleep(retry_delay * 2)
-                    continue
-                else:
-                    sonarr_logger.error(f"Giving up after {retries_per_page+1} timeout failures")
-                    break
+        total_records = data.get('totalRecords', len(records))
+        total_pages = (total_records + page_size - 1) // page_size
 
-            except requests.exceptions.RequestException as e:
-                error_details = f"Error: {e}"
-                if hasattr(e, 'response') and e.response is not None:
-                    error_details += f", Status Code: {e.response.status_code}"
-                    if hasattr(e.response, 'text') and e.response.text:
-                        error_details += f", Response: {e.response.text[:500]}"
-
-                sonarr_logger.error(f"Request error for cutoff unmet page {page} (attempt {retry_count+1}): {error_details}")
-                if retry_count < retries_per_page:
-                    retry_count += 1
-                    time.sleep(retry_delay)
-                    continue
-                else:
-                    sonarr_logger.error(f"Giving up on request after {retries_per_page+1} failed attempts")
-                    break
+        if records and total_pages > 1:
+            # Page 1 told us how many pages exist, so the rest are independent
+            # and can ride the connection pool concurrently
+            sonarr_logger.debug(f"Fetching remaining {total_pages - 1} missing episode pages concurrently")
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                for page_data in executor.map(
+                    lambda p: _fetch_wanted_page(url, api_key, page_params(p), api_timeout, "missing episodes"),
+                    range(2, total_pages + 1)
+                ):
+                    if page_data:
+                        _extend_filtered(all_missing_episodes, page_data.get('records', []), monitored_only)
+
+    sonarr_logger.info(f"Total missing episodes fetched across all pages (monitored_only={monitored_only}): {len(all_missing_episodes)}")
+    return all_missing_episodes
 
-            except Exception as e:
-                sonarr_logger.error(f"Unexpected error for cutoff unmet page {page} (attempt {retry_count+1}): {e}", exc_info=True)
-                if retry_count < retries_per_page:
-                    retry_count += 1
-                    time.sleep(retry_delay)
-                    continue
-                else:
-                    sonarr_logger.error(f"Giving up after unexpected error and {retries_per_page+1} attempts")
-                    break
+def get_cutoff_unmet_episodes(api_url: str, api_key: str, api_timeout: int, monitored_only: bool) -> List[Dict[str, Any]]:
+    """Get cutoff unmet episodes from Sonarr, handling pagination."""
+    page_size = 1000
+    all_cutoff_unmet = []
 
-        if not success or not records:
-            break
+    sonarr_logger.debug(f"Starting fetch for cutoff unmet episodes (monitored_only={monitored_only}).")
 
-        page += 1
+    url = f"{_base_for(api_url)}/api/v3/wanted/cutoff"
 
-    sonarr_logger.info(f"Total cutoff unmet episodes fetched across all pages: {len(all_cutoff_unmet)}")
+    def page_params(page: int) -> Dict[str, Any]:
+        return {
+            "page": page,
+            "pageSize": page_size,
+            "includeSeries": "true",
+            "sortKey": "airDateUtc",
+            "sortDir": "asc",
+            "monitored": monitored_only
+        }
 
-    if monitored_only:
-        original_count = len(all_cutoff_unmet)
-        filtered_cutoff_unmet = [
-            ep for ep in all_cutoff_unmet
-            if ep.get('series', {}).get('monitored', False) and ep.get('monitored', False)
-        ]
-        sonarr_logger.debug(f"Filtered for monitored_only=True: {len(filtered_cutoff_unmet)} monitored cutoff unmet episodes remain (out of {original_count} total).")
-        return filtered_cutoff_unmet
-    else:
-        sonarr_logger.debug(f"Returning {len(all_cutoff_unmet)} cutoff unmet episodes (monitored_only=False).")
-        return all_cutoff_unmet
+    data = _fetch_wanted_page(url, api_key, page_params(1), api_timeout, "cutoff unmet")
+    if data:
+        records = data.get('records', [])
+        _extend_filtered(all_cutoff_unmet, records, monitored_only)
 
-def get_cutoff_unmet_episodes_random_page(api_url: str, api_key: str, api_timeout: int, monitored_only: bool, count: int) -> List[Dict[str, Any]]:
+        total_records = data.get('totalRecords', len(records))
+        total_pages = (total_records + page_size - 1) // page_size
+        sonarr_logger.info(f"Sonarr API reports {total_records} total cutoff unmet records.")
+
+        if records and total_pages > 1:
+            # Page 1 told us how many pages exist, so the rest are independent
+            # and can ride the connection pool concurrently
+            sonarr_logger.debug(f"Fetching remaining {total_pages - 1} cutoff unmet pages concurrently")
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                for page_data in executor.map(
+                    lambda p: _fetch_wanted_page(url, api_key, page_params(p), api_timeout, "cutoff unmet"),
+                    range(2, total_pages + 1)
+                ):
+                    if page_data:
+                        _extend_filtered(all_cutoff_unmet, page_data.get('records', []), monitored_only)
+
+    sonarr_logger.info(f"Total cutoff unmet episodes fetched across all pages (monitored_only={monitored_only}): {len(all_cutoff_unmet)}")
+    return all_cutoff_unmet
+
+def get_cutoff_unmet_episodes_random_page(api_url: str, api_key: str, api_timeout: int, monitored_only: bool, count: int, series_ids: Optional[Iterable[int]] = None) -> List[Dict[str, Any]]:
     """
     Get a specified number of random cutoff unmet episodes by selecting a random page.
+
+    When series_ids is given, records from other series are dropped before
+    sampling so the random draw only spends its budget on eligible episodes.
+    (wanted/cutoff has no multi-series query parameter, so the gate can't be
+    pushed to the server.)
     """
     endpoint = "wanted/cutoff"
     page_size = 100
 
-    params = {
-        "page": 1,
-        "pageSize": 1,
-        "includeSeries": "true",
-        "monitored": monitored_only
-    }
-    url = f"{api_url}/api/v3/{endpoint}"
+    url = f"{_base_for(api_url)}/api/v3/{endpoint}"
 
     try:
-        response = requests.get(url, headers={"X-Api-Key": api_key}, params=params, timeout=api_timeout)
-        response.raise_for_status()
-        data = response.json()
-        total_records = data.get('totalRecords', 0)
+        total_records = _get_wanted_total_records(api_url, api_key, api_timeout, endpoint, monitored_only)
+        if total_records is None:
+            sonarr_logger.warning("Could not determine total cutoff unmet record count.")
+            return []
 
         if total_records == 0:
             sonarr_logger.info("No cutoff unmet episodes found in Sonarr.")
@@ -532,8 +856,7 @@ def get_cutoff_unmet_episodes_random_page(api_url: str, api_key: str, api_timeou
         if total_pages == 0:
             return []
 
-        import random
-        random_page = random.randint(1, total_pages)
+        random_page = _rng.randint(1, total_pages)
         sonarr_logger.info(f"Selected random page {random_page} of {total_pages} for quality upgrade selection")
 
         params = {
@@ -543,13 +866,18 @@ def get_cutoff_unmet_episodes_random_page(api_url: str, api_key: str, api_timeou
             "monitored": monitored_only
         }
 
-        response = requests.get(url, headers={"X-Api-Key": api_key}, params=params, timeout=api_timeout)
+        response = session.get(url, headers=_auth_headers(api_key), params=params, timeout=api_timeout)
         response.raise_for_status()
 
-        data = response.json()
+        data = _loads(response.content)
         records = data.get('records', [])
         sonarr_logger.info(f"Retrieved {len(records)} episodes from page {random_page}")
 
+        if series_ids is not None:
+            allowed = frozenset(series_ids)
+            records = [ep for ep in records if ep.get('seriesId') in allowed]
+            sonarr_logger.debug(f"Filtered to {len(records)} cutoff unmet episodes in the {len(allowed)} allowed series")
+
         if monitored_only:
             filtered_records = [
                 ep for ep in records
@@ -559,7 +887,7 @@ def get_cutoff_unmet_episodes_random_page(api_url: str, api_key: str, api_timeou
             records = filtered_records
 
         if len(records) > count:
-            selected_records = random.sample(records, count)
+            selected_records = _rng.sample(records, count)
             sonarr_logger.debug(f"Randomly selected {len(selected_records)} episodes from page {random_page}")
             return selected_records
         else:
@@ -569,130 +897,100 @@ def get_cutoff_unmet_episodes_random_page(api_url: str, api_key: str, api_timeou
     except requests.exceptions.RequestException as e:
         sonarr_logger.error(f"Error getting random cutoff unmet episodes from Sonarr: {str(e)}")
         return []
-    except json.JSONDecodeError as e:
+    except _JSONDecodeError as e:
         sonarr_logger.error(f"Failed to decode JSON response for random cutoff selection: {str(e)}")
         return []
     except Exception as e:
         sonarr_logger.error(f"Unexpected error in random cutoff selection: {str(e)}", exc_info=True)
         return []
 
-def get_missing_episodes_random_page(api_url: str, api_key: str, api_timeout: int, monitored_only: bool, count: int, series_id: Optional[int] = None) -> List[Dict[str, Any]]:
+def get_missing_episodes_random_page(api_url: str, api_key: str, api_timeout: int, monitored_only: bool, count: int, series_id: Optional[int] = None, series_ids: Optional[Iterable[int]] = None) -> List[Dict[str, Any]]:
     """
     Get a specified number of random missing episodes by selecting a random page.
+
+    Transient failures are retried by the session adapter, so this runs a
+    single straight-line attempt instead of its own retry loop.
+
+    When series_ids is given, records from other series are dropped before
+    sampling so the random draw only spends its budget on eligible episodes.
+    (wanted/missing only accepts a single seriesId query parameter, so a
+    multi-series gate can't be pushed to the server.)
     """
     endpoint = "wanted/missing"
     page_size = 100
-    retries = 2
-    retry_delay = 3
 
-    params = {
-        "page": 1,
-        "pageSize": 1,
-        "includeSeries": "true",
-        "monitored": monitored_only
-    }
-    url = f"{api_url}/api/v3/{endpoint}"
+    url = f"{_base_for(api_url)}/api/v3/{endpoint}"
 
-    for attempt in range(retries + 1):
-        try:
-            sonarr_logger.debug(f"Getting missing episodes count (attempt {attempt+1}/{retries+1})")
-            response = requests.get(url, headers={"X-Api-Key": api_key}, params=params, timeout=api_timeout)
-            response.raise_for_status()
+    try:
+        total_records = _get_wanted_total_records(api_url, api_key, api_timeout, endpoint, monitored_only)
 
-            if not response.content:
-                sonarr_logger.warning(f"Empty response when getting missing count (attempt {attempt+1})")
-                if attempt < retries:
-                    time.sleep(retry_delay)
-                    continue
-                return []
+        if total_records is None:
+            sonarr_logger.warning("Empty response when getting missing count")
+            return []
 
-            try:
-                data = response.json()
-                total_records = data.get('totalRecords', 0)
+        if total_records == 0:
+            sonarr_logger.info("No missing episodes found in Sonarr.")
+            return []
 
-                if total_records == 0:
-                    sonarr_logger.info("No missing episodes found in Sonarr.")
-                    return []
+        total_pages = (total_records + page_size - 1) // page_size
+        sonarr_logger.info(f"Found {total_records} total missing episodes across {total_pages} pages")
 
-                total_pages = (total_records + page_size - 1) // page_size
-                sonarr_logger.info(f"Found {total_records} total missing episodes across {total_pages} pages")
+        random_page = _rng.randint(1, total_pages)
+        sonarr_logger.info(f"Selected random page {random_page} of {total_pages} for missing episodes")
 
-                if total_pages == 0:
-                    return []
+        params = {
+            "page": random_page,
+            "pageSize": page_size,
+            "includeSeries": "true",
+            "monitored": monitored_only
+        }
 
-                import random
-                random_page = random.randint(1, total_pages)
-                sonarr_logger.info(f"Selected random page {random_page} of {total_pages} for missing episodes")
+        if series_id is not None:
+            params["seriesId"] = series_id
 
-                params = {
-                    "page": random_page,
-                    "pageSize": page_size,
-                    "includeSeries": "true",
-                    "monitored": monitored_only
-                }
+        response = session.get(url, headers=_auth_headers(api_key), params=params, timeout=api_timeout)
+        response.raise_for_status()
 
-                if series_id is not None:
-                    params["seriesId"] = series_id
+        if not response.content:
+            sonarr_logger.warning(f"Empty response when getting missing episodes page {random_page}")
+            return []
 
-                response = requests.get(url, headers={"X-Api-Key": api_key}, params=params, timeout=api_timeout)
-                response.raise_for_status()
+        data = _loads(response.content)
+        records = data.get('records', [])
+        sonarr_logger.info(f"Retrieved {len(records)} missing episodes from page {random_page}")
 
-                if not response.content:
-                    sonarr_logger.warning(f"Empty response when getting missing episodes page {random_page}")
-                    return []
+        if series_ids is not None:
+            allowed = frozenset(series_ids)
+            records = [ep for ep in records if ep.get('seriesId') in allowed]
+            sonarr_logger.debug(f"Filtered to {len(records)} missing episodes in the {len(allowed)} allowed series")
 
-                try:
-                    data = response.json()
-                    records = data.get('records', [])
-                    sonarr_logger.info(f"Retrieved {len(records)} missing episodes from page {random_page}")
-
-                    if monitored_only:
-                        filtered_records = [
-                            ep for ep in records
-                            if ep.get('series', {}).get('monitored', False) and ep.get('monitored', False)
-                        ]
-                        sonarr_logger.debug(f"Filtered to {len(filtered_records)} monitored missing episodes")
-                        records = filtered_records
-
-                    if len(records) > count:
-                        selected_records = random.sample(records, count)
-                        sonarr_logger.debug(f"Randomly selected {len(selected_records)} missing episodes from page {random_page}")
-                        return selected_records
-                    else:
-                        sonarr_logger.debug(f"Returning all {len(records)} missing episodes from page {random_page} (fewer than requested {count})")
-                        return records
-
-                except json.JSONDecodeError as jde:
-                    sonarr_logger.error(f"Failed to decode JSON response for missing episodes page {random_page}: {str(jde)}")
-                    if attempt < retries:
-                        time.sleep(retry_delay)
-                        continue
-                    return []
-
-            except json.JSONDecodeError as jde:
-                sonarr_logger.error(f"Failed to decode JSON response for missing episodes count: {str(jde)}")
-                if attempt < retries:
-                    time.sleep(retry_delay)
-                    continue
-                return []
+        if monitored_only:
+            filtered_records = [
+                ep for ep in records
+                if ep.get('series', {}).get('monitored', False) and ep.get('monitored', False)
+            ]
+            sonarr_logger.debug(f"Filtered to {len(filtered_records)} monitored missing episodes")
+            records = filtered_records
 
-        except requests.exceptions.RequestException as e:
-            sonarr_logger.error(f"Error getting missing episodes from Sonarr (attempt {attempt+1}): {str(e)}")
-            if attempt < retries:
-                time.sleep(retry_delay)
-                continue
-            return []
+        if len(records) > count:
+            selected_records = _rng.sample(records, count)
+            sonarr_logger.debug(f"Randomly selected {len(selected_records)} missing episodes from page {random_page}")
+            return selected_records
 
-        except Exception as e:
-            sonarr_logger.error(f"Unexpected error getting missing episodes (attempt {attempt+1}): {str(e)}", exc_info=True)
-            if attempt < retries:
-                time.sleep(retry_delay)
-                continue
-            return []
+        sonarr_logger.debug(f"Returning all {len(records)} missing episodes from page {random_page} (fewer than requested {count})")
+        return records
 
-    sonarr_logger.error("All attempts to get missing episodes failed")
-    return []
+    except _JSONDecodeError as e:
+        sonarr_logger.error(f"Failed to decode JSON response for missing episode selection: {str(e)}")
+        return []
+    except requests.exceptions.RequestException as e:
+        sonarr_logger.error(f"Error getting missing episodes from Sonarr: {str(e)}")
+        return []
+    except Exception as e:
+        sonarr_logger.error(f"Unexpected error getting missing episodes: {str(e)}", exc_info=True)
+        return []
 
+@_sonarr_call("search_episode")
 def search_episode(api_url: str, api_key: str, api_timeout: int, episode_ids: List[int]) -> Optional[Union[int, str]]:
     """Trigger a search for specific episodes in Sonarr."""
     if not episode_ids:
@@ -700,267 +998,179 @@ def search_episode(api_url: str, api_key: str, api_timeout: int, episode_ids: Li
         return None
 
     try:
-        from src.primary.stats_manager import check_hourly_cap_exceeded
-        if check_hourly_cap_exceeded("sonarr"):
+        if _cap_exceeded():
             sonarr_logger.warning(f"🛑 Sonarr API hourly limit reached - skipping episode search for {len(episode_ids)} episodes")
             return None
     except Exception as e:
         sonarr_logger.error(f"Error checking hourly API cap: {e}")
 
-    try:
-        endpoint = f"{api_url}/api/v3/command"
-        payload = {
-            "name": "EpisodeSearch",
-            "episodeIds": episode_ids
-        }
-        response = requests.post(endpoint, headers={"X-Api-Key": api_key}, json=payload, timeout=api_timeout)
-        response.raise_for_status()
-        command_id = response.json().get('id')
-        sonarr_logger.info(f"Triggered Sonarr search for episode IDs: {episode_ids}. Command ID: {command_id}")
+    endpoint = f"{_base_for(api_url)}/api/v3/command"
+    # Serialize once with orjson instead of letting requests re-encode
+    # the payload through stdlib json on every search
+    body = _dumps({
+        "name": "EpisodeSearch",
+        "episodeIds": episode_ids
+    })
+    response = session.post(endpoint, headers={"X-Api-Key": api_key, "Content-Type": "application/json"},
+                            data=body, timeout=api_timeout)
+    response.raise_for_status()
+    command_id = _loads(response.content).get('id')
+    sonarr_logger.info(f"Triggered Sonarr search for episode IDs: {episode_ids}. Command ID: {command_id}")
+    _invalidate_total_records(api_url)
 
-        try:
-            from src.primary.stats_manager import increment_hourly_cap
-            increment_hourly_cap("sonarr", 1)
-            sonarr_logger.debug(f"Incremented Sonarr hourly API cap for episode search ({len(episode_ids)} episodes)")
-        except Exception as cap_error:
-            sonarr_logger.error(f"Failed to increment hourly API cap for episode search: {cap_error}")
+    try:
+        _count_api_hit()
+        sonarr_logger.debug(f"Incremented Sonarr hourly API cap for episode search ({len(episode_ids)} episodes)")
+    except Exception as cap_error:
+        sonarr_logger.error(f"Failed to increment hourly API cap for episode search: {cap_error}")
 
-        return command_id
-    except requests.exceptions.RequestException as e:
-        sonarr_logger.error(f"Error triggering Sonarr search for episode IDs {episode_ids}: {e}")
-        return None
-    except Exception as e:
-        sonarr_logger.error(f"An unexpected error occurred while triggering Sonarr search: {e}")
-        return None
+    return command_id
 
 def get_command_status(api_url: str, api_key: str, api_timeout: int, command_id: Union[int, str]) -> Optional[Dict[str, Any]]:
-    """Get the status of a Sonarr command."""
-    try:
-        endpoint = f"{api_url}/api/v3/command/{command_id}"
-        response = requests.get(endpoint, headers={"X-Api-Key": api_key}, timeout=api_timeout)
-        response.raise_for_status()
-        status = response.json()
+    """Get the status of a Sonarr command.
+
+    Goes through arr_request so repeated polls benefit from ETag
+    revalidation - an unchanged command comes back as a bodyless 304.
+    """
+    status = arr_request(api_url, api_key, api_timeout, f"command/{command_id}", count_api=False)
+    if status is not None:
         sonarr_logger.debug(f"Checked Sonarr command status for ID {command_id}: {status.get('status')}")
-        return status
-    except requests.exceptions.RequestException as e:
-        sonarr_logger.error(f"Error getting Sonarr command status for ID {command_id}: {e}")
-        return None
-    except Exception as e:
-        sonarr_logger.error(f"An unexpected error occurred while getting Sonarr command status: {e}")
-        return None
+    return status
 
+@_sonarr_call("get_download_queue_size", default=-1)
 def get_download_queue_size(api_url: str, api_key: str, api_timeout: int) -> int:
     """Get the current size of the Sonarr download queue."""
-    retries = 2
-    retry_delay = 3
-
-    for attempt in range(retries + 1):
-        try:
-            endpoint = f"{api_url}/api/v3/queue?page=1&pageSize=1"
-            response = requests.get(endpoint, headers={"X-Api-Key": api_key}, params={"includeSeries": "false"}, timeout=api_timeout)
-            response.raise_for_status()
-
-            if not response.content:
-                sonarr_logger.warning(f"Empty response when getting queue size (attempt {attempt+1}/{retries+1})")
-                if attempt < retries:
-                    time.sleep(retry_delay)
-                    continue
-                return -1
-
-            try:
-                queue_data = response.json()
-                queue_size = queue_data.get('totalRecords', 0)
-                sonarr_logger.debug(f"Sonarr download queue size: {queue_size}")
-                return queue_size
-            except json.JSONDecodeError as jde:
-                sonarr_logger.error(f"Failed to decode queue JSON (attempt {attempt+1}/{retries+1}): {jde}")
-                if attempt < retries:
-                    time.sleep(retry_delay)
-                    continue
-                return -1
-
-        except requests.exceptions.RequestException as e:
-            sonarr_logger.error(f"Error getting Sonarr download queue size (attempt {attempt+1}/{retries+1}): {e}")
-            if attempt < retries:
-                sonarr_logger.info(f"Retrying in {retry_delay} seconds...")
-                time.sleep(retry_delay)
-                continue
-            return -1
-        except Exception as e:
-            sonarr_logger.error(f"Unexpected error getting queue size (attempt {attempt+1}/{retries+1}): {e}")
-            if attempt < retries:
-                time.sleep(retry_delay)
-                continue
-            return -1
+    # pageSize=0 returns totalRecords with an empty records array, so no
+    # queue item bodies are transferred or parsed just to read the count
+    endpoint = f"{_base_for(api_url)}/api/v3/queue"
+    params = {
+        "page": 1,
+        "pageSize": 0,
+        "includeUnknownSeriesItems": "false",
+        "includeSeries": "false",
+        "includeEpisode": "false"
+    }
+    response = session.get(endpoint, headers=_auth_headers(api_key), params=params, timeout=api_timeout)
+    response.raise_for_status()
 
-    sonarr_logger.error(f"All {retries+1} attempts to get download queue size failed")
-    return -1
+    if not response.content:
+        sonarr_logger.warning("Empty response when getting queue size")
+        return -1
 
-def refresh_series(api_url: str, api_key: str, api_timeout: int, series_id: int) -> Optional[Union[int, str]]:
-    """Refresh functionality has been removed as it was a performance bottleneck."""
-    sonarr_logger.debug(f"Refresh functionality disabled for series ID: {series_id}")
-    return 123
+    queue_data = _loads(response.content)
+    queue_size = queue_data.get('totalRecords', 0)
+    sonarr_logger.debug(f"Sonarr download queue size: {queue_size}")
+    return queue_size
 
 def get_series_by_id(api_url: str, api_key: str, api_timeout: int, series_id: int) -> Optional[Dict[str, Any]]:
-    """Get series details by ID from Sonarr."""
-    try:
-        endpoint = f"{api_url}/api/v3/series/{series_id}"
-        response = requests.get(endpoint, headers={"X-Api-Key": api_key}, timeout=api_timeout)
-        response.raise_for_status()
-        series_data = response.json()
+    """Get series details by ID from Sonarr, cached briefly per series."""
+    cache_key = (api_url, series_id)
+    cached = _SERIES_BY_ID_CACHE.get(cache_key)
+    now = time.monotonic()
+    if cached and now - cached[0] < _METADATA_CACHE_TTL:
+        return cached[1]
+    series_data = arr_request(api_url, api_key, api_timeout, f"series/{series_id}", count_api=False)
+    if series_data is not None:
         sonarr_logger.debug(f"Fetched details for Sonarr series ID: {series_id}")
-        return series_data
-    except requests.exceptions.RequestException as e:
-        sonarr_logger.error(f"Error getting Sonarr series details for ID {series_id}: {e}")
-        return None
-    except Exception as e:
-        sonarr_logger.error(f"An unexpected error occurred while getting Sonarr series details: {e}")
-        return None
+        _SERIES_BY_ID_CACHE[cache_key] = (now, series_data)
+    return series_data
 
+@_sonarr_call("search_season")
 def search_season(api_url: str, api_key: str, api_timeout: int, series_id: int, season_number: int) -> Optional[Union[int, str]]:
     """Trigger a search for a specific season in Sonarr."""
     try:
-        from src.primary.stats_manager import check_hourly_cap_exceeded
-        if check_hourly_cap_exceeded("sonarr"):
+        if _cap_exceeded():
             sonarr_logger.warning(f"🛑 Sonarr API hourly limit reached - skipping season search for series {series_id}, season {season_number}")
             return None
     except Exception as e:
         sonarr_logger.error(f"Error checking hourly API cap: {e}")
 
-    try:
-        endpoint = f"{api_url}/api/v3/command"
-        payload = {
-            "name": "SeasonSearch",
-            "seriesId": series_id,
-            "seasonNumber": season_number
-        }
-        response = requests.post(endpoint, headers={"X-Api-Key": api_key}, json=payload, timeout=api_timeout)
-        response.raise_for_status()
-        command_id = response.json().get('id')
-        sonarr_logger.info(f"Triggered Sonarr season search for series ID: {series_id}, season: {season_number}. Command ID: {command_id}")
+    endpoint = f"{_base_for(api_url)}/api/v3/command"
+    payload = {
+        "name": "SeasonSearch",
+        "seriesId": series_id,
+        "seasonNumber": season_number
+    }
+    response = session.post(endpoint, headers=_auth_headers(api_key), json=payload, timeout=api_timeout)
+    response.raise_for_status()
+    command_id = _loads(response.content).get('id')
+    sonarr_logger.info(f"Triggered Sonarr season search for series ID: {series_id}, season: {season_number}. Command ID: {command_id}")
 
-        try:
-            from src.primary.stats_manager import increment_hourly_cap
-            increment_hourly_cap("sonarr", 1)
-            sonarr_logger.debug(f"Incremented Sonarr hourly API cap for season search (series: {series_id}, season: {season_number})")
-        except Exception as cap_error:
-            sonarr_logger.error(f"Failed to increment hourly API cap for season search: {cap_error}")
+    try:
+        _count_api_hit()
+        sonarr_logger.debug(f"Incremented Sonarr hourly API cap for season search (series: {series_id}, season: {season_number})")
+    except Exception as cap_error:
+        sonarr_logger.error(f"Failed to increment hourly API cap for season search: {cap_error}")
 
-        return command_id
-    except requests.exceptions.RequestException as e:
-        sonarr_logger.error(f"Error triggering Sonarr season search for series ID {series_id}, season {season_number}: {e}")
-        return None
-    except Exception as e:
-        sonarr_logger.error(f"An unexpected error occurred while triggering Sonarr season search: {e}")
-        return None
+    return command_id
 
 def get_cutoff_unmet_episodes_for_series(api_url: str, api_key: str, api_timeout: int, series_id: int, monitored_only: bool = True) -> List[Dict[str, Any]]:
-    """Get all cutoff unmet episodes for a specific series, handling pagination."""
+    """
+    Get all cutoff unmet episodes for a specific series, handling pagination.
+
+    Page 1 reveals totalRecords, so any remaining pages are fetched in
+    parallel instead of one at a time.
+    """
     endpoint = "wanted/cutoff"
-    page = 1
     page_size = 1000
-    all_cutoff_unmet = []
-    retries_per_page = 2
-    retry_delay = 3
 
     sonarr_logger.debug(f"Fetching cutoff unmet episodes for series ID {series_id} using direct API filter (monitored_only={monitored_only})")
 
-    while True:
-        retry_count = 0
-        success = False
-        records = []
-
-        while retry_count <= retries_per_page and not success:
-            params = {
-                "page": page,
-                "pageSize": page_size,
-                "includeSeries": "true",
-                "sortKey": "airDateUtc",
-                "sortDir": "asc",
-                "seriesId": series_id,
-                "monitored": monitored_only
-            }
-            url = f"{api_url}/api/v3/{endpoint}"
-            sonarr_logger.debug(f"Requesting cutoff unmet page {page} for series {series_id} (attempt {retry_count+1}/{retries_per_page+1})")
+    url = f"{_base_for(api_url)}/api/v3/{endpoint}"
+    label = f"cutoff unmet (series {series_id})"
 
-            try:
-                response = requests.get(url, headers={"X-Api-Key": api_key}, params=params, timeout=api_timeout)
-                sonarr_logger.debug(f"Sonarr API response status code for cutoff unmet page {page}: {response.status_code}")
-                response.raise_for_status()
+    # The server already filters by seriesId and monitored; this defensive
+    # check runs once per record as it arrives instead of as extra passes
+    # over the assembled list afterwards
+    def _keep(record: Dict[str, Any]) -> bool:
+        if record.get('seriesId') != series_id:
+            return False
+        if monitored_only:
+            return bool(record.get('monitored') and (record.get('series') or {}).get('monitored'))
+        return True
 
-                if not response.content:
-                    sonarr_logger.warning(f"Empty response for cutoff unmet episodes page {page} (attempt {retry_count+1})")
-                    if retry_count < retries_per_page:
-                        retry_count += 1
-                        time.sleep(retry_delay)
-                        continue
-                    else:
-                        sonarr_logger.error(f"Giving up on empty response after {retries_per_page+1} attempts")
-                        break
+    def page_params(page: int) -> Dict[str, Any]:
+        return {
+            "page": page,
+            "pageSize": page_size,
+            "includeSeries": "true",
+            "sortKey": "airDateUtc",
+            "sortDir": "asc",
+            "seriesId": series_id,
+            "monitored": monitored_only
+        }
 
-                try:
-                    data = response.json()
-                    records = data.get('records', [])
-                    total_records_on_page = len(records)
-
-                    if not records:
-                        sonarr_logger.debug(f"No more cutoff unmet records found on page {page}. Stopping pagination.")
-                        success = True
-                        break
-
-                    all_cutoff_unmet.extend(records)
-
-                    if total_records_on_page < page_size:
-                        sonarr_logger.debug(f"Received {total_records_on_page} records (less than page size {page_size}). Last page.")
-                        success = True
-                        break
-
-                    success = True
-                    break
-
-                except json.JSONDecodeError as e:
-                    sonarr_logger.error(f"Failed to decode JSON for cutoff unmet page {page} (attempt {retry_count+1}): {e}")
-                    if retry_count < retries_per_page:
-                        retry_count += 1
-                        time.sleep(retry_delay)
-                        continue
-                    else:
-                        sonarr_logger.error(f"Giving up on JSON decode error after {retries_per_page+1} attempts")
-                        break
+    first = _fetch_wanted_page(url, api_key, page_params(1), api_timeout, label)
+    if not first:
+        return []
 
-            except requests.exceptions.RequestException as e:
-                sonarr_logger.error(f"Request error for cutoff unmet page {page} (attempt {retry_count+1}): {e}")
-                if retry_count < retries_per_page:
-                    retry_count += 1
-                    time.sleep(retry_delay)
+    records = first.get('records', [])
+    all_cutoff_unmet = [r for r in records if _keep(r)]
+
+    total_records = first.get('totalRecords', len(records))
+    total_pages = (total_records + page_size - 1) // page_size
+
+    if total_pages > 1:
+        sonarr_logger.debug(f"Fetching remaining {total_pages - 1} cutoff unmet pages for series {series_id} in parallel")
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            pages = executor.map(
+                lambda p: _fetch_wanted_page(url, api_key, page_params(p), api_timeout, label),
+                range(2, total_pages + 1)
+            )
+            for data in pages:
+                if not data:
                     continue
-                else:
-                    sonarr_logger.error(f"Giving up after request error and {retries_per_page+1} attempts")
-                    break
+                all_cutoff_unmet.extend(r for r in data.get('records', []) if _keep(r))
 
-        if not success or not records:
-            break
-
-        page += 1
-
-    verified_episodes = [ep for ep in all_cutoff_unmet if ep.get('seriesId') == series_id]
-
-    sonarr_logger.info(f"Found {len(verified_episodes)} cutoff unmet episodes for series {series_id}")
-
-    if monitored_only:
-        original_count = len(verified_episodes)
-        filtered_episodes = [
-            ep for ep in verified_episodes
-            if ep.get('series', {}).get('monitored', False) and ep.get('monitored', False)
-        ]
-        sonarr_logger.debug(f"Filtered for monitored_only=True: {len(filtered_episodes)} monitored episodes (out of {original_count} total)")
-        return filtered_episodes
-    else:
-        return verified_episodes
+    sonarr_logger.info(f"Found {len(all_cutoff_unmet)} cutoff unmet episodes for series {series_id}")
+    return all_cutoff_unmet
 
 def get_series_with_missing_episodes(api_url: str, api_key: str, api_timeout: int, monitored_only: bool = True, limit: int = 50, random_mode: bool = True) -> List[Dict[str, Any]]:
     """
     Get a list of series that have missing episodes, along with missing episode counts per season.
+
+    Uses a single bulk wanted/missing scan bucketed by series instead of one
+    episode-list request per candidate series.
     """
     # Step 1: Get all series
     all_series = get_series(api_url, api_key, api_timeout)
@@ -975,166 +1185,185 @@ def get_series_with_missing_episodes(api_url: str, api_key: str, api_timeout: in
     else:
         filtered_series = all_series
 
+    eligible_titles = {s['id']: s.get('title', 'Unknown') for s in filtered_series if s.get('id')}
+
+    # Step 3: One paginated wanted/missing scan, bucketed by series. The
+    # server already knows which episodes are missing, so this collapses the
+    # per-series episode fetches into ~ceil(total_missing/1000) requests.
+    by_series: Dict[int, List[Dict[str, Any]]] = defaultdict(list)
+    for episode in iter_missing_episodes(api_url, api_key, api_timeout, monitored_only):
+        series_id = episode.get('seriesId')
+        if series_id in eligible_titles:
+            by_series[series_id].append(episode)
+
+    candidate_ids = [s['id'] for s in filtered_series if s.get('id') in by_series]
+
     if random_mode:
-        import random
         sonarr_logger.info(f"Using RANDOM selection mode for missing episodes")
-        random.shuffle(filtered_series)
+        # Draw exactly the series we need instead of shuffling the whole list
+        selected_ids = _rng.sample(candidate_ids, min(limit, len(candidate_ids)))
     else:
         sonarr_logger.info(f"Using SEQUENTIAL selection mode for missing episodes")
+        selected_ids = candidate_ids[:limit]
 
     series_with_missing = []
-    examined_count = 0
+    for series_id in selected_ids:
+        missing_episodes = by_series[series_id]
 
-    for series in filtered_series[:limit]:
-        examined_count += 1
-        series_id = series.get('id')
-        series_title = series.get('title', 'Unknown')
+        seasons_dict = {}
+        for episode in missing_episodes:
+            season_number = episode.get('seasonNumber')
+            if season_number is not None:
+                seasons_dict.setdefault(season_number, []).append(episode)
 
-        if not series_id:
+        if not seasons_dict:
             continue
 
-        try:
-            endpoint = f"{api_url}/api/v3/episode?seriesId={series_id}"
-            response = requests.get(endpoint, headers={"X-Api-Key": api_key}, timeout=api_timeout)
-            response.raise_for_status()
-
-            if not response.content:
-                continue
-
-            episodes = response.json()
-
-            missing_episodes = [
-                e for e in episodes
-                if e.get('hasFile') is False and
-                (not monitored_only or e.get('monitored', False))
-            ]
-
-            if not missing_episodes:
-                continue
-
-            seasons_dict = {}
-            for episode in missing_episodes:
-                season_number = episode.get('seasonNumber')
-                if season_number is not None:
-                    seasons_dict.setdefault(season_number, []).append(episode)
-
-            if seasons_dict:
-                missing_info = {
-                    'series_id': series_id,
-                    'series_title': series_title,
-                    'seasons': [
-                        {
-                            'season_number': season,
-                            'episode_count': len(eps),
-                            'episodes': eps
-                        }
-                        for season, eps in seasons_dict.items()
-                    ]
+        series_title = eligible_titles[series_id]
+        series_with_missing.append({
+            'series_id': series_id,
+            'series_title': series_title,
+            'episode_count': len(missing_episodes),
+            'seasons': [
+                {
+                    'season_number': season,
+                    'episode_count': len(eps),
+                    'episodes': eps
                 }
-                series_with_missing.append(missing_info)
-
-                sonarr_logger.debug(f"Found series {series_title} with {len(missing_episodes)} missing episodes across {len(seasons_dict)} seasons")
-
-        except Exception as e:
-            sonarr_logger.error(f"Error checking missing episodes for series {series_title} (ID: {series_id}): {str(e)}")
-            continue
+                for season, eps in seasons_dict.items()
+            ]
+        })
+        sonarr_logger.debug(f"Found series {series_title} with {len(missing_episodes)} missing episodes across {len(seasons_dict)} seasons")
 
     selection_mode = "RANDOM" if random_mode else "SEQUENTIAL"
-    sonarr_logger.info(f"Examined {examined_count} series ({selection_mode} mode) and found {len(series_with_missing)} with missing episodes")
+    sonarr_logger.info(f"Examined {len(candidate_ids)} series ({selection_mode} mode) and found {len(series_with_missing)} with missing episodes")
     return series_with_missing
 
+@_sonarr_call("get_or_create_tag")
 def get_or_create_tag(api_url: str, api_key: str, api_timeout: int, tag_label: str) -> Optional[int]:
     """Get existing tag ID or create a new tag in Sonarr."""
-    try:
-        response = arr_request(api_url, api_key, api_timeout, "tag", count_api=False)
-        if response:
-            want = (tag_label or "").strip().lower()
-            for tag in response:
-                if (tag.get('label') or "").strip().lower() == want:
-                    tag_id = tag.get('id')
-                    sonarr_logger.debug(f"Found existing tag '{tag_label}' with ID: {tag_id}")
-                    return tag_id
-
-        tag_data = {"label": tag_label}
-        response = arr_request(api_url, api_key, api_timeout, "tag", method="POST", data=tag_data, count_api=False)
-        if response and 'id' in response:
-            tag_id = response['id']
-            sonarr_logger.info(f"Created new tag '{tag_label}' with ID: {tag_id}")
+    want = (tag_label or "").strip().lower()
+    tag_map = _get_tag_map(api_url, api_key, api_timeout)
+    if tag_map:
+        tag_id = tag_map.get(want)
+        if tag_id is not None:
+            sonarr_logger.debug(f"Found existing tag '{tag_label}' with ID: {tag_id}")
             return tag_id
-        else:
-            sonarr_logger.error(f"Failed to create tag '{tag_label}'. Response: {response}")
-            return None
 
-    except Exception as e:
-        sonarr_logger.error(f"Error managing tag '{tag_label}': {e}")
-        return None
+    tag_data = {"label": tag_label}
+    response = arr_request(api_url, api_key, api_timeout, "tag", method="POST", data=tag_data, count_api=False)
+    if response and 'id' in response:
+        tag_id = response['id']
+        sonarr_logger.info(f"Created new tag '{tag_label}' with ID: {tag_id}")
+        return tag_id
+
+    # A concurrent caller may have created the tag between our lookup and
+    # the POST; Sonarr rejects the duplicate, so refresh the map and
+    # return the winner's id rather than failing
+    _invalidate_metadata_caches(api_url)
+    tag_map = _get_tag_map(api_url, api_key, api_timeout)
+    if tag_map:
+        tag_id = tag_map.get(want)
+        if tag_id is not None:
+            sonarr_logger.debug(f"Tag '{tag_label}' was created concurrently with ID: {tag_id}")
+            return tag_id
+
+    sonarr_logger.error(f"Failed to create tag '{tag_label}'. Response: {response}")
+    return None
+
 
+@_sonarr_call("add_tag_to_series", default=False)
 def add_tag_to_series(api_url: str, api_key: str, api_timeout: int, series_id: int, tag_id: int) -> bool:
     """Add a tag to a series in Sonarr."""
-    try:
-        series_data = arr_request(api_url, api_key, api_timeout, f"series/{series_id}", count_api=False)
-        if not series_data:
-            sonarr_logger.error(f"Failed to get series data for ID: {series_id}")
-            return False
-
-        current_tags = series_data.get('tags', [])
-        if tag_id in current_tags:
-            sonarr_logger.debug(f"Tag {tag_id} already exists on series {series_id}")
-            return True
+    series_data = arr_request(api_url, api_key, api_timeout, f"series/{series_id}", count_api=False)
+    if not series_data:
+        sonarr_logger.error(f"Failed to get series data for ID: {series_id}")
+        return False
 
-        current_tags.append(tag_id)
-        series_data['tags'] = current_tags
+    tag_set = set(series_data.get('tags') or ())
+    if tag_id in tag_set:
+        sonarr_logger.debug(f"Tag {tag_id} already exists on series {series_id}")
+        return True
 
-        response = arr_request(api_url, api_key, api_timeout, f"series/{series_id}", method="PUT", data=series_data, count_api=False)
-        if response:
-            sonarr_logger.debug(f"Successfully added tag {tag_id} to series {series_id}")
-            return True
-        else:
-            sonarr_logger.error(f"Failed to update series {series_id} with tag {tag_id}")
-            return False
+    # The GET result may be the body the ETag cache holds; build a fresh
+    # payload rather than mutating it, so a failed PUT followed by a 304
+    # can't replay our un-applied edit as server state
+    tag_set.add(tag_id)
+    payload = dict(series_data)
+    payload['tags'] = sorted(tag_set)
 
-    except Exception as e:
-        sonarr_logger.error(f"Error adding tag {tag_id} to series {series_id}: {e}")
+    response = arr_request(api_url, api_key, api_timeout, f"series/{series_id}", method="PUT", data=payload, count_api=False)
+    if response:
+        sonarr_logger.debug(f"Successfully added tag {tag_id} to series {series_id}")
+        return True
+    sonarr_logger.error(f"Failed to update series {series_id} with tag {tag_id}")
+    return False
+
+@_sonarr_call("bulk_add_tag_to_series", default=False)
+def bulk_add_tag_to_series(api_url: str, api_key: str, api_timeout: int, series_ids: List[int], tag_id: int) -> bool:
+    """Add a tag to many series with a single series/editor call."""
+    if not series_ids:
+        return True
+    if len(series_ids) == 1:
+        # No batching benefit for a single series; reuse the per-series path
+        return add_tag_to_series(api_url, api_key, api_timeout, series_ids[0], tag_id)
+    editor_data = {
+        "seriesIds": list(series_ids),
+        "tags": [tag_id],
+        "applyTags": "add"
+    }
+    response = arr_request(api_url, api_key, api_timeout, "series/editor", method="PUT", data=editor_data, count_api=False)
+    if response is not None:
+        sonarr_logger.debug(f"Added tag {tag_id} to {len(series_ids)} series via series/editor")
+        return True
+    sonarr_logger.error(f"Failed bulk tag update for {len(series_ids)} series with tag {tag_id}")
+    return False
+
+@_sonarr_call("tag_processed_series_bulk", default=False)
+def tag_processed_series_bulk(api_url: str, api_key: str, api_timeout: int, series_ids: List[int], tag_label: str = "huntarr-missing") -> bool:
+    """Tag many series with one tag lookup and one bulk editor call."""
+    if not series_ids:
+        return True
+    tag_id = get_or_create_tag(api_url, api_key, api_timeout, tag_label)
+    if tag_id is None:
+        sonarr_logger.error(f"Failed to get or create tag '{tag_label}' in Sonarr")
         return False
+    return bulk_add_tag_to_series(api_url, api_key, api_timeout, series_ids, tag_id)
 
+@_sonarr_call("tag_processed_series", default=False)
 def tag_processed_series(api_url: str, api_key: str, api_timeout: int, series_id: int, tag_label: str = "huntarr-missing") -> bool:
     """Tag a series in Sonarr with the specified tag."""
-    try:
-        tag_id = get_or_create_tag(api_url, api_key, api_timeout, tag_label)
-        if tag_id is None:
-            sonarr_logger.error(f"Failed to get or create tag '{tag_label}' in Sonarr")
-            return False
-
-        success = add_tag_to_series(api_url, api_key, api_timeout, series_id, tag_id)
-        if success:
-            sonarr_logger.debug(f"Successfully tagged Sonarr series {series_id} with '{tag_label}'")
-            return True
-        else:
-            sonarr_logger.error(f"Failed to add tag '{tag_label}' to Sonarr series {series_id}")
-            return False
-
-    except Exception as e:
-        sonarr_logger.error(f"Error tagging Sonarr series {series_id} with '{tag_label}': {e}")
+    tag_id = get_or_create_tag(api_url, api_key, api_timeout, tag_label)
+    if tag_id is None:
+        sonarr_logger.error(f"Failed to get or create tag '{tag_label}' in Sonarr")
         return False
 
-def get_quality_profiles(api_url: str, api_key: str, api_timeout: int) -> Optional[List[Dict]]:
-    """Get all quality profiles configured in Sonarr."""
-    try:
-        sonarr_logger.debug("Fetching quality profiles from Sonarr...")
+    success = add_tag_to_series(api_url, api_key, api_timeout, series_id, tag_id)
+    if success:
+        sonarr_logger.debug(f"Successfully tagged Sonarr series {series_id} with '{tag_label}'")
+        return True
+    sonarr_logger.error(f"Failed to add tag '{tag_label}' to Sonarr series {series_id}")
+    return False
 
-        profiles = arr_request(api_url, api_key, api_timeout, "qualityProfile", count_api=False)
+@_sonarr_call("get_quality_profiles")
+def get_quality_profiles(api_url: str, api_key: str, api_timeout: int) -> Optional[List[Dict]]:
+    """Get all quality profiles configured in Sonarr, cached per instance."""
+    cached = _QUALITY_PROFILES_CACHE.get(api_url)
+    now = time.monotonic()
+    if cached and now - cached[0] < _QUALITY_PROFILES_TTL:
+        return cached[1]
+    sonarr_logger.debug("Fetching quality profiles from Sonarr...")
 
-        if profiles is None:
-            sonarr_logger.error("Failed to retrieve quality profiles from Sonarr API.")
-            return None
+    profiles = arr_request(api_url, api_key, api_timeout, "qualityProfile", count_api=False)
 
-        sonarr_logger.debug(f"Found {len(profiles)} quality profiles in Sonarr")
+    if profiles is None:
+        sonarr_logger.error("Failed to retrieve quality profiles from Sonarr API.")
+        return None
 
-        profile_names = [profile.get('name', 'Unknown') for profile in profiles]
-        sonarr_logger.debug(f"Quality profiles: {', '.join(profile_names)}")
+    sonarr_logger.debug(f"Found {len(profiles)} quality profiles in Sonarr")
 
-        return profiles
+    profile_names = [profile.get('name', 'Unknown') for profile in profiles]
+    sonarr_logger.debug(f"Quality profiles: {', '.join(profile_names)}")
 
-    except Exception as e:
-        sonarr_logger.error(f"Error retrieving quality profiles: {str(e)}")
-        return None
+    _QUALITY_PROFILES_CACHE[api_url] = (now, profiles)
+    return profiles
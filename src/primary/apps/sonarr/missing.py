@@ -7,49 +7,77 @@ UPDATED:
 - Only hunts missing for series tagged "search"
 """
 
+import calendar
 import time
 import random
-from typing import List, Dict, Any, Callable, Set
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from itertools import chain
+from typing import List, Dict, Any, Callable, FrozenSet, Optional, Set
 from src.primary.utils.logger import get_logger
-from src.primary.settings_manager import load_settings, get_advanced_setting
+from src.primary.settings_manager import load_settings, get_advanced_setting, get_custom_tag
 from src.primary.utils.history_utils import log_processed_media
-from src.primary.stats_manager import increment_stat, increment_stat_only, check_hourly_cap_exceeded
-from src.primary.stateful_manager import is_processed, add_processed_id
+from src.primary.stats_manager import increment_stat, increment_stat_only, check_hourly_cap_exceeded_cached
+from src.primary.stateful_manager import are_processed, add_processed_id
 from src.primary.apps.sonarr import api as sonarr_api
 
 # Get logger for the Sonarr app
 sonarr_logger = get_logger("sonarr")
 
-def should_delay_episode_search(air_date_str: str, delay_days: int) -> bool:
-    """Delay searches until air date + delay_days."""
-    if delay_days <= 0 or not air_date_str:
-        return False
+@lru_cache(maxsize=8192)
+def _parse_air_unix(air_date_str: str) -> float:
+    """
+    Parse a Sonarr '%Y-%m-%dT%H:%M:%SZ' air date to a UTC epoch.
 
+    Slicing the fixed-width fields and using calendar.timegm avoids the
+    locale lock and Python-level format parsing of time.strptime, and treats
+    the timestamp as the UTC it is (time.mktime interpreted it as local
+    time). Cached because many episodes on a page share air dates.
+    """
+    return float(calendar.timegm((
+        int(air_date_str[0:4]), int(air_date_str[5:7]), int(air_date_str[8:10]),
+        int(air_date_str[11:13]), int(air_date_str[14:16]), int(air_date_str[17:19]),
+        0, 0, 0
+    )))
+
+def _airs_after(air_date_str: str, cutoff_unix: float) -> bool:
+    """True when the air date parses and falls after the given epoch cutoff."""
     try:
-        air_date_unix = time.mktime(time.strptime(air_date_str, '%Y-%m-%dT%H:%M:%SZ'))
-        current_unix = time.time()
-        search_start_unix = air_date_unix + (delay_days * 24 * 60 * 60)
-        return current_unix < search_start_unix
-    except (ValueError, TypeError) as e:
+        return _parse_air_unix(air_date_str) > cutoff_unix
+    except (ValueError, TypeError, IndexError) as e:
         sonarr_logger.warning(f"Could not parse air date '{air_date_str}' for delay calculation: {e}")
         return False
 
-def _get_allowed_series_ids_for_missing(api_url: str, api_key: str, api_timeout: int) -> Set[int]:
+def _season_episode_tag(season_number: Any, episode_number: Any) -> str:
     """
-    Returns a set of series IDs tagged with "search".
-    If tag is missing or no series match, returns empty set.
+    Format an SxxEyy label, tolerating non-int values from partial records.
+
+    A plain isinstance branch instead of try/except around the :02d format,
+    so the per-episode logging path carries no exception-handler setup.
     """
-    sonarr_settings = load_settings("sonarr")
-    search_tag_label = sonarr_settings.get("tag_search_label", "search")
+    if isinstance(season_number, int) and isinstance(episode_number, int):
+        return f"S{season_number:02d}E{episode_number:02d}"
+    return f"S{season_number}E{episode_number}"
 
-    tag_id = sonarr_api.get_tag_id_by_label(api_url, api_key, api_timeout, search_tag_label)
-    if tag_id is None:
+def should_delay_episode_search(air_date_str: str, delay_days: int) -> bool:
+    """Delay searches until air date + delay_days."""
+    if delay_days <= 0 or not air_date_str:
+        return False
+    return _airs_after(air_date_str, time.time() - delay_days * 86400)
+
+def _get_allowed_series_ids_for_missing(api_url: str, api_key: str, api_timeout: int) -> FrozenSet[int]:
+    """
+    Returns a frozenset of series IDs tagged with "search".
+    If tag is missing or no series match, returns an empty frozenset.
+    """
+    search_tag_label = load_settings("sonarr").get("tag_search_label", "search")
+
+    allowed = sonarr_api.get_series_ids_with_tag_label(api_url, api_key, api_timeout, search_tag_label)
+    if allowed is None:
         sonarr_logger.warning(
             f"Sonarr tag '{search_tag_label}' not found. Skipping missing processing to avoid hunting everything."
         )
-        return set()
-
-    allowed = sonarr_api.get_series_ids_with_tag(api_url, api_key, api_timeout, tag_id)
+        return frozenset()
     if not allowed:
         sonarr_logger.info(f"No Sonarr series tagged '{search_tag_label}' found. Nothing to hunt.")
     return allowed
@@ -58,20 +86,29 @@ def process_missing_episodes(
     api_url: str,
     api_key: str,
     instance_name: str,
-    api_timeout: int = get_advanced_setting("api_timeout", 120),
+    api_timeout: Optional[int] = None,
     monitored_only: bool = True,
     skip_future_episodes: bool = True,
     hunt_missing_items: int = 5,
     hunt_missing_mode: str = "seasons_packs",
     air_date_delay_days: int = 0,
-    command_wait_delay: int = get_advanced_setting("command_wait_delay", 1),
-    command_wait_attempts: int = get_advanced_setting("command_wait_attempts", 600),
+    command_wait_delay: Optional[int] = None,
+    command_wait_attempts: Optional[int] = None,
     stop_check: Callable[[], bool] = lambda: False
 ) -> bool:
     """
     Process missing episodes for Sonarr.
     Supports seasons_packs, shows, and episodes modes.
     """
+    # Resolve advanced-setting defaults at call time; evaluating them in the
+    # signature froze the values at import
+    if api_timeout is None:
+        api_timeout = get_advanced_setting("api_timeout", 120)
+    if command_wait_delay is None:
+        command_wait_delay = get_advanced_setting("command_wait_delay", 1)
+    if command_wait_attempts is None:
+        command_wait_attempts = get_advanced_setting("command_wait_attempts", 600)
+
     if hunt_missing_items <= 0:
         sonarr_logger.info("'hunt_missing_items' setting is 0 or less. Skipping missing processing.")
         return False
@@ -128,7 +165,7 @@ def process_missing_seasons_packs_mode(
     command_wait_delay: int,
     command_wait_attempts: int,
     stop_check: Callable[[], bool],
-    allowed_series_ids: Set[int]
+    allowed_series_ids: FrozenSet[int]
 ) -> bool:
     """
     Process missing seasons using the SeasonSearch command (season packs).
@@ -139,65 +176,55 @@ def process_missing_seasons_packs_mode(
     sonarr_settings = load_settings("sonarr")
     tag_processed_items = sonarr_settings.get("tag_processed_items", True)
 
+    # Tag gate pushed down: the random-page fetch drops episodes outside the
+    # allowed series before sampling, so its budget isn't spent on records
+    # this mode would immediately discard
     missing_episodes = sonarr_api.get_missing_episodes_random_page(
-        api_url, api_key, api_timeout, monitored_only, hunt_missing_items * 20
+        api_url, api_key, api_timeout, monitored_only, hunt_missing_items * 20,
+        series_ids=allowed_series_ids
     )
     if not missing_episodes:
         sonarr_logger.info("No missing episodes found")
         return False
 
-    # Tag gate (search tag): keep only episodes belonging to tagged series
-    missing_episodes = [
-        ep for ep in missing_episodes
-        if int(ep.get("seriesId") or 0) in allowed_series_ids
-    ]
-
-    if not missing_episodes:
-        sonarr_logger.info("No missing episodes found for series tagged 'search'.")
-        return False
-
-    sonarr_logger.info(f"Retrieved {len(missing_episodes)} missing episodes from random page selection (after tag gating).")
-
-    # Filter out future episodes if configured
-    if skip_future_episodes:
-        now_unix = time.time()
-        filtered_episodes = []
-        skipped_count = 0
-
-        for episode in missing_episodes:
-            air_date_str = episode.get('airDateUtc')
-            if air_date_str:
-                try:
-                    air_date_unix = time.mktime(time.strptime(air_date_str, '%Y-%m-%dT%H:%M:%SZ'))
-                    if air_date_unix < now_unix:
-                        filtered_episodes.append(episode)
-                    else:
-                        skipped_count += 1
-                        sonarr_logger.debug(f"Skipping future episode ID {episode.get('id')} with air date: {air_date_str}")
-                except (ValueError, TypeError) as e:
-                    sonarr_logger.warning(
-                        f"Could not parse air date '{air_date_str}' for episode ID {episode.get('id')}. Error: {e}. Including it."
-                    )
-                    filtered_episodes.append(episode)
-            else:
-                filtered_episodes.append(episode)
+    # Single pass: monitored check and future skip fused so each episode
+    # dict is touched once instead of once per filter stage
+    now_unix = time.time()
+    eligible_episodes = []
+    skipped_count = 0
+    for episode in missing_episodes:
+        if monitored_only and not episode.get('monitored', False):
+            continue
+        air_date_str = episode.get('airDateUtc')
+        if skip_future_episodes and air_date_str:
+            try:
+                if _parse_air_unix(air_date_str) >= now_unix:
+                    skipped_count += 1
+                    sonarr_logger.debug(f"Skipping future episode ID {episode.get('id')} with air date: {air_date_str}")
+                    continue
+            except (ValueError, TypeError, IndexError) as e:
+                sonarr_logger.warning(
+                    f"Could not parse air date '{air_date_str}' for episode ID {episode.get('id')}. Error: {e}. Including it."
+                )
+        eligible_episodes.append(episode)
 
-        missing_episodes = filtered_episodes
-        if skipped_count > 0:
-            sonarr_logger.info(f"Skipped {skipped_count} future episodes based on air date.")
+    missing_episodes = eligible_episodes
+    if skipped_count > 0:
+        sonarr_logger.info(f"Skipped {skipped_count} future episodes based on air date.")
 
     if not missing_episodes:
-        sonarr_logger.info("No missing episodes left to process after filtering future episodes.")
+        sonarr_logger.info("No eligible missing episodes for series tagged 'search'.")
         return False
 
+    sonarr_logger.info(f"Retrieved {len(missing_episodes)} eligible missing episodes from random page selection.")
+
     # NOTE: air_date_delay_days intentionally not applied in season pack mode (it was previously buggy)
 
-    # Group episodes by series and season
-    missing_seasons: Dict[str, Dict[str, Any]] = {}
+    # Group episodes by series and season (eligibility already settled above).
+    # A tuple key hashes straight off the ints; the f-string key paid for
+    # string formatting on every episode
+    missing_seasons: Dict[tuple, Dict[str, Any]] = {}
     for episode in missing_episodes:
-        if monitored_only and not episode.get('monitored', False):
-            continue
-
         series_id = episode.get('seriesId')
         if not series_id:
             continue
@@ -205,7 +232,7 @@ def process_missing_seasons_packs_mode(
         season_number = episode.get('seasonNumber')
         series_title = episode.get('series', {}).get('title', 'Unknown Series')
 
-        key = f"{series_id}:{season_number}"
+        key = (series_id, season_number)
         if key not in missing_seasons:
             missing_seasons[key] = {
                 'series_id': series_id,
@@ -218,14 +245,16 @@ def process_missing_seasons_packs_mode(
     seasons_list = list(missing_seasons.values())
     seasons_list.sort(key=lambda x: x['episode_count'], reverse=True)
 
-    # Filter out already processed seasons
-    unprocessed_seasons = []
-    for season in seasons_list:
-        season_id = f"{season['series_id']}_{season['season_number']}"
-        if not is_processed("sonarr", instance_name, season_id):
-            unprocessed_seasons.append(season)
-        else:
-            sonarr_logger.debug(f"Skipping already processed season ID: {season_id}")
+    # Filter out already processed seasons in one bulk lookup instead of a
+    # database round-trip per candidate
+    season_ids = [f"{season['series_id']}_{season['season_number']}" for season in seasons_list]
+    already_done = are_processed("sonarr", instance_name, season_ids)
+    unprocessed_seasons = [
+        season for season, season_id in zip(seasons_list, season_ids)
+        if season_id not in already_done
+    ]
+    if already_done:
+        sonarr_logger.debug(f"Skipping {len(already_done)} already processed seasons")
 
     sonarr_logger.info(f"Found {len(unprocessed_seasons)} unprocessed seasons with missing episodes out of {len(seasons_list)} total.")
 
@@ -233,29 +262,30 @@ def process_missing_seasons_packs_mode(
         sonarr_logger.info("All seasons with missing episodes have been processed.")
         return False
 
-    random.shuffle(unprocessed_seasons)
+    # Draw exactly the seasons we need; sampling is O(k) where shuffling the
+    # whole candidate list was O(N)
+    seasons_to_process = random.sample(unprocessed_seasons, k=min(len(unprocessed_seasons), hunt_missing_items))
 
     processed_count = 0
+    triggered_command_ids: List[int] = []
+    # The tag label only depends on settings; resolve it once per cycle
+    # instead of per processed season
+    custom_tag = get_custom_tag("sonarr", "missing", "huntarr-missing") if tag_processed_items else None
+
+    sonarr_logger.info(f"Randomly selected {len(seasons_to_process)} seasons with missing episodes:")
+    for idx, season in enumerate(seasons_to_process):
+        sonarr_logger.info(
+            f"  {idx+1}. {season['series_title']} - Season {season['season_number']} "
+            f"({season['episode_count']} missing episodes) (Series ID: {season['series_id']})"
+        )
 
-    if unprocessed_seasons and hunt_missing_items > 0:
-        seasons_to_process = unprocessed_seasons[:hunt_missing_items]
-        sonarr_logger.info(f"Randomly selected {min(len(unprocessed_seasons), hunt_missing_items)} seasons with missing episodes:")
-        for idx, season in enumerate(seasons_to_process):
-            sonarr_logger.info(
-                f"  {idx+1}. {season['series_title']} - Season {season['season_number']} "
-                f"({season['episode_count']} missing episodes) (Series ID: {season['series_id']})"
-            )
-
-    for season in unprocessed_seasons:
-        if processed_count >= hunt_missing_items:
-            break
-
+    for season in seasons_to_process:
         if stop_check():
             sonarr_logger.info("Stop signal received, halting processing.")
             break
 
         try:
-            if check_hourly_cap_exceeded("sonarr"):
+            if check_hourly_cap_exceeded_cached("sonarr"):
                 sonarr_logger.warning(f"🛑 Sonarr API hourly limit reached - stopping season pack processing after {processed_count} seasons")
                 break
         except Exception as e:
@@ -279,8 +309,6 @@ def process_missing_seasons_packs_mode(
 
             # Tag the series if enabled
             if tag_processed_items:
-                from src.primary.settings_manager import get_custom_tag
-                custom_tag = get_custom_tag("sonarr", "missing", "huntarr-missing")
                 try:
                     sonarr_api.tag_processed_series(api_url, api_key, api_timeout, series_id, custom_tag)
                     sonarr_logger.debug(f"Tagged series {series_id} with '{custom_tag}'")
@@ -290,18 +318,23 @@ def process_missing_seasons_packs_mode(
             media_name = f"{series_title} - Season {season_number} (contains {episode_count} missing episodes)"
             log_processed_media("sonarr", media_name, season_id, instance_name, "missing")
 
-            # Increment hunted stats for each missing episode in the season (API call already tracked in search_season)
-            for _ in range(episode_count):
-                increment_stat_only("sonarr", "hunted")
+            # Increment hunted stats for every missing episode in the season
+            # in one write (the API call is already tracked in search_season)
+            increment_stat_only("sonarr", "hunted", episode_count)
 
-            if command_wait_delay > 0 and command_wait_attempts > 0:
-                wait_for_command(
-                    api_url, api_key, api_timeout, command_id,
-                    command_wait_delay, command_wait_attempts, "Season Search", stop_check
-                )
+            triggered_command_ids.append(command_id)
         else:
             sonarr_logger.error(f"Failed to trigger season search for {series_title} Season {season_number}.")
 
+    # All searches were queued back-to-back above; waiting on the batch here
+    # means K seasons finish in roughly the slowest search's duration instead
+    # of the sum of all of them
+    if triggered_command_ids and command_wait_delay > 0 and command_wait_attempts > 0:
+        wait_for_commands(
+            api_url, api_key, api_timeout, triggered_command_ids,
+            command_wait_delay, command_wait_attempts, "Season Search", stop_check
+        )
+
     sonarr_logger.info(f"Processed {processed_count} missing season packs for Sonarr.")
     return processed_any
 
@@ -317,13 +350,15 @@ def process_missing_shows_mode(
     command_wait_delay: int,
     command_wait_attempts: int,
     stop_check: Callable[[], bool],
-    allowed_series_ids: Set[int]
+    allowed_series_ids: FrozenSet[int]
 ) -> bool:
     """Process missing episodes in show mode - gets all missing episodes for entire shows (tag-gated)."""
     processed_any = False
 
     sonarr_settings = load_settings("sonarr")
     tag_processed_items = sonarr_settings.get("tag_processed_items", True)
+    # Resolved once per cycle; every processed show uses the same label
+    custom_tag = get_custom_tag("sonarr", "shows_missing", "huntarr-shows-missing") if tag_processed_items else None
 
     sonarr_logger.info("Retrieving series with missing episodes...")
     series_with_missing = sonarr_api.get_series_with_missing_episodes(
@@ -337,20 +372,22 @@ def process_missing_shows_mode(
     # Tag gate: only series tagged search
     series_with_missing = [
         s for s in series_with_missing
-        if int(s.get("series_id") or 0) in allowed_series_ids
+        if s.get("series_id") in allowed_series_ids
     ]
 
     if not series_with_missing:
         sonarr_logger.info("No series tagged 'search' have missing episodes.")
         return False
 
-    unprocessed_series = []
-    for series in series_with_missing:
-        series_id = str(series.get("series_id"))
-        if not is_processed("sonarr", instance_name, series_id):
-            unprocessed_series.append(series)
-        else:
-            sonarr_logger.debug(f"Skipping already processed series ID: {series_id}")
+    # Dedup against processed state with one bulk lookup
+    series_ids = [str(series.get("series_id")) for series in series_with_missing]
+    already_done = are_processed("sonarr", instance_name, series_ids)
+    unprocessed_series = [
+        series for series, series_id in zip(series_with_missing, series_ids)
+        if series_id not in already_done
+    ]
+    if already_done:
+        sonarr_logger.debug(f"Skipping {len(already_done)} already processed series")
 
     sonarr_logger.info(f"Found {len(unprocessed_series)} unprocessed series with missing episodes out of {len(series_with_missing)} total.")
 
@@ -365,27 +402,32 @@ def process_missing_shows_mode(
         for idx, show in enumerate(shows_to_process):
             show_id = show.get('series_id')
             show_title = show.get('series_title', 'Unknown Show')
-            episode_count = sum(season.get('episode_count', 0) for season in show.get('seasons', []))
+            # Count pre-aggregated by get_series_with_missing_episodes
+            episode_count = show.get('episode_count', 0)
             sonarr_logger.info(f"  {idx+1}. {show_title} ({episode_count} missing episodes) (Show ID: {show_id})")
 
-    for show in shows_to_process:
+    # Each show is one search POST, an optional tag PUT, and a long poll in
+    # wait_for_command; fan the shows out so cycle time is bounded by the
+    # slowest show rather than the sum of all of them
+    def _process_one_show(show: Dict[str, Any]) -> bool:
         if stop_check():
-            sonarr_logger.info("Stop signal received, halting processing.")
-            break
+            sonarr_logger.info("Stop signal received, skipping show processing.")
+            return False
 
         try:
-            if check_hourly_cap_exceeded("sonarr"):
-                sonarr_logger.warning("🛑 Sonarr API hourly limit reached - stopping shows processing")
-                break
+            if check_hourly_cap_exceeded_cached("sonarr"):
+                sonarr_logger.warning("🛑 Sonarr API hourly limit reached - skipping shows processing")
+                return False
         except Exception as e:
             sonarr_logger.error(f"Error checking hourly API cap: {e}")
 
         show_id = show.get("series_id")
         show_title = show.get("series_title", "Unknown Show")
 
-        missing_episodes = []
-        for season in show.get('seasons', []):
-            missing_episodes.extend(season.get('episodes', []))
+        # One C-level flatten instead of a Python-level extend loop
+        missing_episodes = list(chain.from_iterable(
+            season.get('episodes', ()) for season in show.get('seasons', ())
+        ))
 
         if skip_future_episodes:
             now_unix = time.time()
@@ -397,7 +439,7 @@ def process_missing_shows_mode(
                     filtered.append(ep)
                     continue
                 try:
-                    if time.mktime(time.strptime(air, '%Y-%m-%dT%H:%M:%SZ')) < now_unix:
+                    if _parse_air_unix(air) < now_unix:
                         filtered.append(ep)
                     else:
                         skipped += 1
@@ -408,71 +450,76 @@ def process_missing_shows_mode(
                 sonarr_logger.info(f"Skipped {skipped} future episodes for {show_title} based on air date.")
 
         if air_date_delay_days > 0:
-            delayed_episodes = []
-            delayed_count = 0
-            for episode in missing_episodes:
-                air_date_str = episode.get('airDateUtc')
-                if should_delay_episode_search(air_date_str, air_date_delay_days):
-                    delayed_count += 1
-                else:
-                    delayed_episodes.append(episode)
-            missing_episodes = delayed_episodes
+            # One cutoff for the whole batch; the per-episode check is then a
+            # single float compare against the cached parsed epoch
+            delay_cutoff_unix = time.time() - air_date_delay_days * 86400
+            kept = [
+                ep for ep in missing_episodes
+                if not (air := ep.get('airDateUtc')) or not _airs_after(air, delay_cutoff_unix)
+            ]
+            delayed_count = len(missing_episodes) - len(kept)
+            missing_episodes = kept
             if delayed_count > 0:
                 sonarr_logger.info(f"Delayed {delayed_count} episodes for {show_title} due to {air_date_delay_days}-day air date delay setting.")
 
         if not missing_episodes:
             sonarr_logger.info(f"No eligible missing episodes found for {show_title} after filtering.")
-            continue
+            return False
 
         episode_ids = [episode.get('id') for episode in missing_episodes if episode.get('id')]
         if not episode_ids:
             sonarr_logger.warning(f"No valid episode IDs found for {show_title}.")
-            continue
+            return False
 
         sonarr_logger.info(f"Searching for {len(episode_ids)} missing episodes for {show_title}...")
         command_id = sonarr_api.search_episode(api_url, api_key, api_timeout, episode_ids)
 
-        if command_id:
-            processed_any = True
-            sonarr_logger.info(f"Successfully triggered search for {len(episode_ids)} missing episodes in {show_title}")
+        if not command_id:
+            sonarr_logger.error(f"Failed to trigger search for {show_title}.")
+            return False
 
-            if tag_processed_items:
-                from src.primary.settings_manager import get_custom_tag
-                custom_tag = get_custom_tag("sonarr", "shows_missing", "huntarr-shows-missing")
-                try:
-                    sonarr_api.tag_processed_series(api_url, api_key, api_timeout, show_id, custom_tag)
-                    sonarr_logger.debug(f"Tagged series {show_id} with '{custom_tag}'")
-                except Exception as e:
-                    sonarr_logger.warning(f"Failed to tag series {show_id} with '{custom_tag}': {e}")
+        sonarr_logger.info(f"Successfully triggered search for {len(episode_ids)} missing episodes in {show_title}")
 
-            for episode_id in episode_ids:
-                add_processed_id("sonarr", instance_name, str(episode_id))
+        if tag_processed_items:
+            try:
+                sonarr_api.tag_processed_series(api_url, api_key, api_timeout, show_id, custom_tag)
+                sonarr_logger.debug(f"Tagged series {show_id} with '{custom_tag}'")
+            except Exception as e:
+                sonarr_logger.warning(f"Failed to tag series {show_id} with '{custom_tag}': {e}")
 
-                for episode in missing_episodes:
-                    if episode.get('id') == episode_id:
-                        season = episode.get('seasonNumber', 'Unknown')
-                        ep_num = episode.get('episodeNumber', 'Unknown')
-                        title = episode.get('title', 'Unknown Title')
-                        try:
-                            season_episode = f"S{season:02d}E{ep_num:02d}"
-                        except Exception:
-                            season_episode = f"S{season}E{ep_num}"
-                        media_name = f"{show_title} - {season_episode} - {title}"
-                        log_processed_media("sonarr", media_name, str(episode_id), instance_name, "missing")
-                        break
+        # Index once so the logging pass is a dict hit per episode instead of
+        # a scan of missing_episodes for every id
+        ep_by_id = {ep['id']: ep for ep in missing_episodes if ep.get('id')}
+        for episode_id, episode in ep_by_id.items():
+            add_processed_id("sonarr", instance_name, str(episode_id))
 
-            add_processed_id("sonarr", instance_name, str(show_id))
-            log_processed_media("sonarr", f"{show_title} - Complete Series ({len(episode_ids)} episodes)", str(show_id), instance_name, "missing")
+            season = episode.get('seasonNumber', 'Unknown')
+            ep_num = episode.get('episodeNumber', 'Unknown')
+            title = episode.get('title', 'Unknown Title')
+            season_episode = _season_episode_tag(season, ep_num)
+            media_name = f"{show_title} - {season_episode} - {title}"
+            log_processed_media("sonarr", media_name, str(episode_id), instance_name, "missing")
 
-            increment_stat("sonarr", "hunted", len(episode_ids))
+        add_processed_id("sonarr", instance_name, str(show_id))
+        log_processed_media("sonarr", f"{show_title} - Complete Series ({len(episode_ids)} episodes)", str(show_id), instance_name, "missing")
 
-            if command_wait_delay > 0 and command_wait_attempts > 0:
-                wait_for_command(
-                    api_url, api_key, api_timeout, command_id,
-                    command_wait_delay, command_wait_attempts, "Episode Search", stop_check
-                )
-        else:
-            sonarr_logger.error(f"Failed to trigger search for {show_title}.")
+        increment_stat("sonarr", "hunted", len(episode_ids))
+
+        if command_wait_delay > 0 and command_wait_attempts > 0:
+            wait_for_command(
+                api_url, api_key, api_timeout, command_id,
+                command_wait_delay, command_wait_attempts, "Episode Search", stop_check
+            )
+        return True
+
+    with ThreadPoolExecutor(max_workers=min(8, len(shows_to_process))) as executor:
+        futures = [executor.submit(_process_one_show, show) for show in shows_to_process]
+        for future in as_completed(futures):
+            try:
+                if future.result():
+                    processed_any = True
+            except Exception as e:
+                sonarr_logger.error(f"Error processing show for missing episodes: {e}")
 
     sonarr_logger.info("Show-based missing episode processing complete.")
     return processed_any
@@ -489,7 +536,7 @@ def process_missing_episodes_mode(
     command_wait_delay: int,
     command_wait_attempts: int,
     stop_check: Callable[[], bool],
-    allowed_series_ids: Set[int]
+    allowed_series_ids: FrozenSet[int]
 ) -> bool:
     """
     Process missing episodes in individual episode mode (tag-gated).
@@ -498,70 +545,58 @@ def process_missing_episodes_mode(
 
     sonarr_logger.warning("Using Episodes mode - This will make more API calls and does not support tagging")
 
+    # Tag gate pushed down into the random-page fetch
     missing_episodes = sonarr_api.get_missing_episodes_random_page(
-        api_url, api_key, api_timeout, monitored_only, hunt_missing_items * 2
+        api_url, api_key, api_timeout, monitored_only, hunt_missing_items * 2,
+        series_ids=allowed_series_ids
     )
 
     if not missing_episodes:
         sonarr_logger.info("No missing episodes found for individual processing.")
         return False
 
-    # Tag gate (search tag)
-    missing_episodes = [
-        ep for ep in missing_episodes
-        if int(ep.get("seriesId") or 0) in allowed_series_ids
-    ]
-
-    if not missing_episodes:
-        sonarr_logger.info("No missing episodes found for series tagged 'search' (episodes mode).")
-        return False
-
-    if skip_future_episodes:
-        now_unix = time.time()
-        filtered_episodes = []
-        skipped_count = 0
-
-        for episode in missing_episodes:
-            air_date_str = episode.get('airDateUtc')
-            if air_date_str:
-                try:
-                    air_date_unix = time.mktime(time.strptime(air_date_str, '%Y-%m-%dT%H:%M:%SZ'))
-                    if air_date_unix < now_unix:
-                        filtered_episodes.append(episode)
-                    else:
-                        skipped_count += 1
-                except Exception:
-                    filtered_episodes.append(episode)
-            else:
-                filtered_episodes.append(episode)
-
-        missing_episodes = filtered_episodes
-        if skipped_count > 0:
-            sonarr_logger.info(f"Skipped {skipped_count} future episodes based on air date.")
+    # Single pass: future and delay skips fused, so the episode list is
+    # walked once rather than once per filter stage
+    now_unix = time.time()
+    delay_cutoff_unix = now_unix - air_date_delay_days * 86400 if air_date_delay_days > 0 else None
+    filtered_episodes = []
+    skipped_count = 0
+    for episode in missing_episodes:
+        air_date_str = episode.get('airDateUtc')
+        if air_date_str:
+            try:
+                air_unix = _parse_air_unix(air_date_str)
+            except Exception:
+                air_unix = None
+            if air_unix is not None:
+                if skip_future_episodes and air_unix >= now_unix:
+                    skipped_count += 1
+                    continue
+                if delay_cutoff_unix is not None and air_unix > delay_cutoff_unix:
+                    continue
+        filtered_episodes.append(episode)
 
-    if air_date_delay_days > 0:
-        delayed_episodes = []
-        for episode in missing_episodes:
-            if not should_delay_episode_search(episode.get('airDateUtc'), air_date_delay_days):
-                delayed_episodes.append(episode)
-        missing_episodes = delayed_episodes
+    missing_episodes = filtered_episodes
+    if skipped_count > 0:
+        sonarr_logger.info(f"Skipped {skipped_count} future episodes based on air date.")
 
     if not missing_episodes:
-        sonarr_logger.info("No missing episodes left to process after filtering.")
+        sonarr_logger.info("No missing episodes left to process after filtering (episodes mode).")
         return False
 
-    unprocessed_episodes = []
-    for episode in missing_episodes:
-        episode_id = str(episode.get('id'))
-        if not is_processed("sonarr", instance_name, episode_id):
-            unprocessed_episodes.append(episode)
+    # Dedup against processed state with one bulk lookup
+    episode_ids = [str(episode.get('id')) for episode in missing_episodes]
+    already_done = are_processed("sonarr", instance_name, episode_ids)
+    unprocessed_episodes = [
+        episode for episode, episode_id in zip(missing_episodes, episode_ids)
+        if episode_id not in already_done
+    ]
 
     if not unprocessed_episodes:
         sonarr_logger.info("All missing episodes have been processed.")
         return False
 
-    random.shuffle(unprocessed_episodes)
-    episodes_to_process = unprocessed_episodes[:hunt_missing_items]
+    episodes_to_process = random.sample(unprocessed_episodes, k=min(len(unprocessed_episodes), hunt_missing_items))
 
     processed_count = 0
     for episode in episodes_to_process:
@@ -570,7 +605,7 @@ def process_missing_episodes_mode(
             break
 
         try:
-            if check_hourly_cap_exceeded("sonarr"):
+            if check_hourly_cap_exceeded_cached("sonarr"):
                 sonarr_logger.warning(f"🛑 Sonarr API hourly limit reached - stopping episodes processing after {processed_count} episodes")
                 break
         except Exception as e:
@@ -583,10 +618,7 @@ def process_missing_episodes_mode(
         episode_number = episode.get('episodeNumber', 'Unknown')
         episode_title = episode.get('title', 'Unknown Episode')
 
-        try:
-            season_episode = f"S{season_number:02d}E{episode_number:02d}"
-        except Exception:
-            season_episode = f"S{season_number}E{episode_number}"
+        season_episode = _season_episode_tag(season_number, episode_number)
 
         sonarr_logger.info(f"Processing episode: {series_title} - {season_episode} - {episode_title}")
 
@@ -615,51 +647,124 @@ def process_missing_episodes_mode(
     sonarr_logger.warning("Episodes mode processing complete - consider using Season Packs mode for better efficiency")
     return processed_any
 
-def wait_for_command(
+def _sleep_unless_stopped(delay: float, stop_check: Callable[[], bool]) -> bool:
+    """
+    Sleep up to delay seconds, polling stop_check every half second.
+
+    Returns True when a stop was requested mid-sleep. Stop signals travel
+    through the app as callables rather than threading.Events, so slicing
+    the sleep is what bounds stop latency at ~0.5s instead of the full
+    (backed-off, up to 30s) poll delay.
+    """
+    deadline = time.monotonic() + delay
+    while True:
+        if stop_check():
+            return True
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        time.sleep(min(0.5, remaining))
+
+def wait_for_commands(
     api_url: str,
     api_key: str,
     api_timeout: int,
-    command_id: int,
+    command_ids: List[int],
     wait_delay: int,
     max_attempts: int,
     command_name: str = "Command",
     stop_check: Callable[[], bool] = lambda: False
 ) -> bool:
-    """Wait for a Sonarr command to complete or timeout."""
-    if wait_delay <= 0 or max_attempts <= 0:
-        sonarr_logger.debug(f"Not waiting for command to complete (wait_delay={wait_delay}, max_attempts={max_attempts})")
+    """
+    Wait for a batch of Sonarr commands to complete or timeout.
+
+    All pending commands are polled in the same tick, so a batch finishes in
+    roughly the duration of the slowest command instead of the sum of them.
+
+    Deliberately REST polling: Sonarr's SignalR hub could push command
+    completion over one persistent connection, but that would pull in a
+    websocket client plus the SignalR negotiate/handshake protocol for a
+    path the backoff below already keeps to a handful of requests.
+
+    Returns True when every command completed successfully.
+    """
+    if wait_delay <= 0 or max_attempts <= 0 or not command_ids:
+        sonarr_logger.debug(f"Not waiting for commands to complete (wait_delay={wait_delay}, max_attempts={max_attempts})")
         return True
 
     sonarr_logger.debug(
-        f"Waiting for {command_name} to complete (command ID: {command_id}). "
-        f"Checking every {wait_delay}s for up to {max_attempts} attempts"
+        f"Waiting for {len(command_ids)} {command_name} command(s) to complete (IDs: {command_ids}). "
+        f"Starting at {wait_delay}s between checks for up to {max_attempts * wait_delay}s"
     )
 
+    # Backoff stretches individual sleeps well past wait_delay, so bounding
+    # the loop by attempt count would multiply the worst case; a deadline
+    # keeps the overall timeout budget at the same max_attempts * wait_delay
+    # as the fixed-delay loop (matching wait_for_command in upgrade.py)
+    deadline = time.monotonic() + max_attempts * wait_delay
+    pending = list(command_ids)
+    all_succeeded = True
     attempts = 0
-    while attempts < max_attempts:
+    while time.monotonic() < deadline:
         if stop_check():
             sonarr_logger.info(f"Stopping wait for {command_name} due to stop request")
             return False
 
-        command_status = sonarr_api.get_command_status(api_url, api_key, api_timeout, command_id)
-        if not command_status:
-            sonarr_logger.warning(f"Failed to get status for {command_name} (ID: {command_id}), attempt {attempts+1}")
-            attempts += 1
-            time.sleep(wait_delay)
-            continue
-
-        status = command_status.get('status')
-        if status == 'completed':
-            sonarr_logger.debug(f"Sonarr {command_name} (ID: {command_id}) completed successfully")
-            return True
-        elif status in ['failed', 'aborted']:
-            sonarr_logger.warning(f"Sonarr {command_name} (ID: {command_id}) {status}")
-            return False
-
-        sonarr_logger.debug(f"Sonarr {command_name} (ID: {command_id}) status: {status}, attempt {attempts+1}/{max_attempts}")
+        still_pending = []
+        fetch_failed = False
+        for command_id in pending:
+            command_status = sonarr_api.get_command_status(api_url, api_key, api_timeout, command_id)
+            if not command_status:
+                sonarr_logger.warning(f"Failed to get status for {command_name} (ID: {command_id}), attempt {attempts+1}")
+                fetch_failed = True
+                still_pending.append(command_id)
+                continue
+
+            status = command_status.get('status')
+            if status == 'completed':
+                sonarr_logger.debug(f"Sonarr {command_name} (ID: {command_id}) completed successfully")
+            elif status in ['failed', 'aborted']:
+                sonarr_logger.warning(f"Sonarr {command_name} (ID: {command_id}) {status}")
+                all_succeeded = False
+            else:
+                sonarr_logger.debug(f"Sonarr {command_name} (ID: {command_id}) status: {status}, attempt {attempts+1}")
+                still_pending.append(command_id)
+
+        pending = still_pending
+        if not pending:
+            return all_succeeded
+
+        # Exponential backoff with jitter: fast commands still complete after
+        # one short wait_delay, slow ones stop hammering the API (the delay
+        # grows 1.5x per attempt, capped at 30s). Status fetch failures
+        # suggest rate limiting or a struggling server, so back off twice as
+        # hard before retrying
+        delay = min(wait_delay * (1.5 ** min(attempts, 8)) + random.uniform(0, wait_delay * 0.1), 30)
+        if fetch_failed:
+            delay = min(delay * 2, 30)
+        # Never sleep past the deadline
+        delay = min(delay, max(deadline - time.monotonic(), 0))
 
         attempts += 1
-        time.sleep(wait_delay)
+        if _sleep_unless_stopped(delay, stop_check):
+            sonarr_logger.info(f"Stopping wait for {command_name} due to stop request")
+            return False
 
-    sonarr_logger.error(f"Sonarr command '{command_name}' (ID: {command_id}) timed out after {max_attempts} attempts.")
+    sonarr_logger.error(f"Sonarr command '{command_name}' (IDs: {pending}) timed out after {max_attempts * wait_delay}s.")
     return False
+
+def wait_for_command(
+    api_url: str,
+    api_key: str,
+    api_timeout: int,
+    command_id: int,
+    wait_delay: int,
+    max_attempts: int,
+    command_name: str = "Command",
+    stop_check: Callable[[], bool] = lambda: False
+) -> bool:
+    """Wait for a single Sonarr command to complete or timeout."""
+    return wait_for_commands(
+        api_url, api_key, api_timeout, [command_id],
+        wait_delay, max_attempts, command_name, stop_check
+    )
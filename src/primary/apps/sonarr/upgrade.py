@@ -6,34 +6,34 @@ UPDATED:
 - Only searches for upgrades on series tagged "done"
 """
 
+import logging
 import time
 import random
-from typing import List, Dict, Any, Callable, Union, Set
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Dict, Any, Callable, FrozenSet, Optional, Set, Union
 from src.primary.utils.logger import get_logger
 from src.primary.apps.sonarr import api as sonarr_api
-from src.primary.stats_manager import increment_stat, check_hourly_cap_exceeded
-from src.primary.stateful_manager import is_processed, add_processed_id
-from src.primary.utils.history_utils import log_processed_media
-from src.primary.settings_manager import get_advanced_setting, load_settings
+from src.primary.stats_manager import increment_stat, increment_stat_only, check_hourly_cap_exceeded_cached
+from src.primary.stateful_manager import add_processed_id, are_processed, add_processed_ids
+from src.primary.utils.history_utils import log_processed_media, log_processed_media_bulk
+from src.primary.settings_manager import get_advanced_setting, load_settings, get_custom_tag
 
 sonarr_logger = get_logger("sonarr")
 
-def _get_allowed_series_ids_for_upgrades(api_url: str, api_key: str, api_timeout: int) -> Set[int]:
+def _get_allowed_series_ids_for_upgrades(api_url: str, api_key: str, api_timeout: int) -> FrozenSet[int]:
     """
-    Returns a set of series IDs tagged with "done".
-    If tag is missing or no series match, returns empty set.
+    Returns a frozenset of series IDs tagged with "done".
+    If tag is missing or no series match, returns an empty frozenset.
     """
-    sonarr_settings = load_settings("sonarr")
-    done_tag_label = sonarr_settings.get("tag_done_label", "done")
+    done_tag_label = load_settings("sonarr").get("tag_done_label", "done")
 
-    tag_id = sonarr_api.get_tag_id_by_label(api_url, api_key, api_timeout, done_tag_label)
-    if tag_id is None:
+    allowed = sonarr_api.get_series_ids_with_tag_label(api_url, api_key, api_timeout, done_tag_label)
+    if allowed is None:
         sonarr_logger.warning(
             f"Sonarr tag '{done_tag_label}' not found. Skipping upgrade processing to avoid upgrading everything."
         )
-        return set()
-
-    allowed = sonarr_api.get_series_ids_with_tag(api_url, api_key, api_timeout, tag_id)
+        return frozenset()
     if not allowed:
         sonarr_logger.info(f"No Sonarr series tagged '{done_tag_label}' found. Nothing to upgrade.")
     return allowed
@@ -64,11 +64,15 @@ def process_cutoff_upgrades(
     )
     sonarr_logger.info(f"Using {upgrade_mode.upper()} mode for quality upgrades")
 
+    # One timestamp for the whole cycle; both modes compare air dates
+    # against the same UTC instant
+    now_iso = time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
+
     if upgrade_mode == "seasons_packs":
         return process_upgrade_seasons_mode(
             api_url, api_key, instance_name, api_timeout, monitored_only,
             hunt_upgrade_items, command_wait_delay, command_wait_attempts, stop_check,
-            allowed_series_ids
+            allowed_series_ids, now_iso
         )
     elif upgrade_mode == "episodes":
         sonarr_logger.warning(
@@ -78,29 +82,12 @@ def process_cutoff_upgrades(
         return process_upgrade_episodes_mode(
             api_url, api_key, instance_name, api_timeout, monitored_only,
             hunt_upgrade_items, command_wait_delay, command_wait_attempts, stop_check,
-            allowed_series_ids
+            allowed_series_ids, now_iso
         )
     else:
         sonarr_logger.error("Invalid upgrade_mode: Valid options are 'seasons_packs' or 'episodes'.")
         return False
 
-def log_season_pack_upgrade(api_url: str, api_key: str, api_timeout: int, series_id: int, season_number: int, instance_name: str):
-    """Log a season pack upgrade to the history."""
-    try:
-        series_details = sonarr_api.get_series(api_url, api_key, api_timeout, series_id)
-        if series_details:
-            series_title = series_details.get('title', f"Series ID {series_id}")
-            try:
-                season_disp = f"S{season_number:02d}" if isinstance(season_number, int) else f"S{season_number}"
-            except Exception:
-                season_disp = f"S{season_number}"
-
-            season_id_num = f"{series_id}_{season_number}"
-            media_name = f"{series_title} - {season_disp}"
-            log_processed_media("sonarr", media_name, season_id_num, instance_name, "upgrade")
-    except Exception as e:
-        sonarr_logger.error(f"Failed to log season pack upgrade to history: {str(e)}")
-
 def process_upgrade_seasons_mode(
     api_url: str,
     api_key: str,
@@ -111,7 +98,8 @@ def process_upgrade_seasons_mode(
     command_wait_delay: int,
     command_wait_attempts: int,
     stop_check: Callable[[], bool],
-    allowed_series_ids: Set[int]
+    allowed_series_ids: FrozenSet[int],
+    now_iso: str
 ) -> bool:
     """Process upgrades in season mode - groups episodes by season (tag-gated to 'done')."""
     processed_any = False
@@ -119,68 +107,75 @@ def process_upgrade_seasons_mode(
     sonarr_settings = load_settings("sonarr")
     tag_processed_items = sonarr_settings.get("tag_processed_items", True)
 
-    skip_episode_history = True
-
+    # Tag gate pushed down: the random-page fetch drops episodes outside the
+    # done-tagged series before sampling, so its budget isn't spent on
+    # records this mode would immediately discard
     sample_size = hunt_upgrade_items * 10
     cutoff_unmet_episodes = sonarr_api.get_cutoff_unmet_episodes_random_page(
-        api_url, api_key, api_timeout, monitored_only, sample_size
+        api_url, api_key, api_timeout, monitored_only, sample_size,
+        series_ids=allowed_series_ids
     )
 
     if not cutoff_unmet_episodes:
         sonarr_logger.info("No cutoff unmet episodes found in Sonarr.")
         return False
 
-    # Tag gate (done tag)
-    cutoff_unmet_episodes = [
-        ep for ep in cutoff_unmet_episodes
-        if int(ep.get("seriesId") or 0) in allowed_series_ids
-    ]
+    # Single pass: tag gate, air-date filter, season grouping, and title
+    # capture fused so each episode dict is touched once instead of once per
+    # stage. ISO-8601 Z timestamps sort lexicographically, so one string
+    # compare against the cycle's now_iso replaces per-episode
+    # strptime/mktime (which also misread the UTC stamp as local time)
+    season_episodes: Dict[tuple, List[Dict[str, Any]]] = {}
+    series_titles: Dict[int, str] = {}
+    eligible_count = 0
+    skipped_count = 0
+    # Bind method lookups once; the body runs for every sampled episode
+    _get = dict.get
+    _group = season_episodes.setdefault
+    for episode in cutoff_unmet_episodes:
+        series_id = _get(episode, "seriesId")
+        if series_id is None:
+            continue
+        air_date = _get(episode, 'airDateUtc')
+        if not air_date:
+            continue
+        if air_date >= now_iso:
+            skipped_count += 1
+            continue
+        season_number = _get(episode, 'seasonNumber')
+        if season_number is None:
+            continue
+        eligible_count += 1
+        _group((series_id, season_number), []).append(episode)
+        if series_id not in series_titles:
+            series_titles[series_id] = _get(episode, 'series', {}).get('title') or f"Series ID {series_id}"
 
-    sonarr_logger.info(f"Received {len(cutoff_unmet_episodes)} cutoff unmet episodes from random page (after tag gating).")
+    sonarr_logger.info(f"Received {eligible_count} eligible cutoff unmet episodes from random page (after tag gating).")
+    if skipped_count > 0:
+        sonarr_logger.info(f"Skipped {skipped_count} future episodes based on air date for upgrades.")
 
-    if not cutoff_unmet_episodes:
+    if not season_episodes:
         sonarr_logger.info("No cutoff unmet episodes found for series tagged 'done'.")
         return False
 
-    now_unix = time.time()
-    original_count = len(cutoff_unmet_episodes)
-    cutoff_unmet_episodes = [
-        ep for ep in cutoff_unmet_episodes
-        if ep.get('airDateUtc') and time.mktime(time.strptime(ep['airDateUtc'], '%Y-%m-%dT%H:%M:%SZ')) < now_unix
-    ]
-    skipped_count = original_count - len(cutoff_unmet_episodes)
-    if skipped_count > 0:
-        sonarr_logger.info(f"Skipped {skipped_count} future episodes based on air date for upgrades.")
-
     if stop_check():
         sonarr_logger.info("Stop requested during upgrade processing.")
         return processed_any
 
-    series_season_episodes: Dict[int, Dict[int, List[Dict]]] = {}
-    for episode in cutoff_unmet_episodes:
-        series_id = episode.get('seriesId')
-        season_number = episode.get('seasonNumber')
-        if series_id is None or season_number is None:
-            continue
-        series_season_episodes.setdefault(series_id, {}).setdefault(season_number, []).append(episode)
-
-    available_seasons = []
-    for series_id, seasons in series_season_episodes.items():
-        for season_number, episodes in seasons.items():
-            series_title = episodes[0].get('series', {}).get('title', f"Series ID {series_id}")
-            available_seasons.append((series_id, season_number, len(episodes), series_title))
-
-    if not available_seasons:
-        sonarr_logger.info("No valid seasons with cutoff unmet episodes found.")
-        return False
+    available_seasons = [
+        (series_id, season_number, len(episodes), series_titles[series_id])
+        for (series_id, season_number), episodes in season_episodes.items()
+    ]
 
-    unprocessed_seasons = []
-    for series_id, season_number, episode_count, series_title in available_seasons:
-        season_id = f"{series_id}_{season_number}"
-        if not is_processed("sonarr", instance_name, season_id):
-            unprocessed_seasons.append((series_id, season_number, episode_count, series_title))
-        else:
-            sonarr_logger.debug(f"Skipping already processed season ID: {season_id} ({series_title} - Season {season_number})")
+    # One bulk processed-state lookup instead of a round-trip per season
+    season_ids = [f"{series_id}_{season_number}" for series_id, season_number, _, _ in available_seasons]
+    already_done = are_processed("sonarr", instance_name, season_ids)
+    unprocessed_seasons = [
+        season for season, season_id in zip(available_seasons, season_ids)
+        if season_id not in already_done
+    ]
+    if already_done:
+        sonarr_logger.debug(f"Skipping {len(already_done)} already processed seasons")
 
     sonarr_logger.info(f"Found {len(unprocessed_seasons)} unprocessed seasons out of {len(available_seasons)} total seasons with cutoff unmet episodes.")
 
@@ -188,79 +183,93 @@ def process_upgrade_seasons_mode(
         sonarr_logger.info("All seasons with cutoff unmet episodes have been processed.")
         return False
 
-    random.shuffle(unprocessed_seasons)
-    seasons_to_process = unprocessed_seasons[:hunt_upgrade_items]
+    # Draw exactly the seasons we need; sampling is O(k) where shuffling the
+    # whole candidate list was O(N)
+    seasons_to_process = random.sample(unprocessed_seasons, k=min(len(unprocessed_seasons), hunt_upgrade_items))
 
     sonarr_logger.info(f"Selected {len(seasons_to_process)} seasons with cutoff unmet episodes to process")
     for idx, (series_id, season_number, episode_count, series_title) in enumerate(seasons_to_process):
-        sonarr_logger.info(f" {idx+1}. {series_title} - Season {season_number} - {episode_count} cutoff unmet episodes")
+        sonarr_logger.info(" %d. %s - Season %s - %d cutoff unmet episodes", idx + 1, series_title, season_number, episode_count)
+
+    custom_tag = get_custom_tag("sonarr", "upgrade", "huntarr-upgraded") if tag_processed_items else None
+    series_to_tag: Set[int] = set()
+    history_entries: List[tuple] = []
+    tag_lock = threading.Lock()
+
+    # Each season is one search POST, a long poll in wait_for_command, and
+    # bookkeeping; fan the seasons out so cycle time is bounded by the
+    # slowest season rather than the sum of all of them
+    def _process_one_season(season: tuple) -> bool:
+        series_id, season_number, episode_count, series_title = season
 
-    for series_id, season_number, episode_count, series_title in seasons_to_process:
         if stop_check():
             sonarr_logger.info("Stop requested during upgrade processing.")
-            break
+            return False
 
-        try:
-            if check_hourly_cap_exceeded("sonarr"):
-                sonarr_logger.warning("🛑 Sonarr API hourly limit reached - stopping upgrade season processing")
-                break
-        except Exception as e:
-            sonarr_logger.error(f"Error checking hourly API cap: {e}")
+        if check_hourly_cap_exceeded_cached("sonarr"):
+            sonarr_logger.warning("🛑 Sonarr API hourly limit reached - skipping upgrade season processing")
+            return False
 
-        sonarr_logger.info(f"Processing season pack upgrade: {series_title} Season {season_number} ({episode_count} cutoff unmet episodes)")
+        sonarr_logger.info("Processing season pack upgrade: %s Season %s (%d cutoff unmet episodes)", series_title, season_number, episode_count)
 
-        episodes = series_season_episodes[series_id][season_number]
+        episodes = season_episodes[(series_id, season_number)]
         episode_ids = [episode["id"] for episode in episodes]
 
         search_command_id = sonarr_api.search_season(api_url, api_key, api_timeout, series_id, season_number)
 
-        if search_command_id:
-            if wait_for_command(
-                api_url, api_key, api_timeout, search_command_id,
-                command_wait_delay, command_wait_attempts, "Episode Upgrade Search", stop_check
-            ):
-                processed_any = True
-                sonarr_logger.info(f"Successfully triggered season pack search for {series_title} Season {season_number} with {len(episode_ids)} cutoff unmet episodes")
-
-                if tag_processed_items:
-                    from src.primary.settings_manager import get_custom_tag
-                    custom_tag = get_custom_tag("sonarr", "upgrade", "huntarr-upgraded")
-                    try:
-                        sonarr_api.tag_processed_series(api_url, api_key, api_timeout, series_id, custom_tag)
-                    except Exception as e:
-                        sonarr_logger.warning(f"Failed to tag series {series_id} with '{custom_tag}': {e}")
-
-                log_season_pack_upgrade(api_url, api_key, api_timeout, series_id, season_number, instance_name)
-
-                season_id = f"{series_id}_{season_number}"
-                add_processed_id("sonarr", instance_name, season_id)
-
-                for episode_id in episode_ids:
-                    add_processed_id("sonarr", instance_name, str(episode_id))
-
-                    from src.primary.stats_manager import increment_stat_only
-                    increment_stat_only("sonarr", "upgraded")
-
-                    if not skip_episode_history:
-                        try:
-                            episode_details = sonarr_api.get_episode(api_url, api_key, api_timeout, episode_id)
-                            if episode_details:
-                                s_title = episode_details.get('series', {}).get('title', 'Unknown Series')
-                                e_title = episode_details.get('title', 'Unknown Episode')
-                                s_num = episode_details.get('seasonNumber', 'Unknown Season')
-                                e_num = episode_details.get('episodeNumber', 'Unknown Episode')
-                                try:
-                                    season_episode = f"S{s_num:02d}E{e_num:02d}"
-                                except Exception:
-                                    season_episode = f"S{s_num}E{e_num}"
-                                media_name = f"{s_title} - {season_episode} - {e_title}"
-                                log_processed_media("sonarr", media_name, episode_id, instance_name, "upgrade")
-                        except Exception as e:
-                            sonarr_logger.error(f"Failed to log history for episode ID {episode_id}: {str(e)}")
-            else:
-                sonarr_logger.warning(f"Season pack search command for {series_title} Season {season_number} did not complete successfully")
-        else:
-            sonarr_logger.error(f"Failed to trigger season pack search command for {series_title} Season {season_number}")
+        if not search_command_id:
+            sonarr_logger.error("Failed to trigger season pack search command for %s Season %s", series_title, season_number)
+            return False
+
+        if not wait_for_command(
+            api_url, api_key, api_timeout, search_command_id,
+            command_wait_delay, command_wait_attempts, "Episode Upgrade Search", stop_check
+        ):
+            sonarr_logger.warning("Season pack search command for %s Season %s did not complete successfully", series_title, season_number)
+            return False
+
+        sonarr_logger.info("Successfully triggered season pack search for %s Season %s with %d cutoff unmet episodes", series_title, season_number, len(episode_ids))
+
+        if tag_processed_items:
+            # Collected here, tagged in one series/editor call after the pool
+            # drains instead of one PUT per season
+            with tag_lock:
+                series_to_tag.add(series_id)
+
+        # History entries are buffered here and flushed in one batch after
+        # the pool drains, so workers only pay for the string formatting
+        season_disp = f"S{season_number:02d}" if isinstance(season_number, int) else f"S{season_number}"
+        season_id = f"{series_id}_{season_number}"
+        with tag_lock:
+            history_entries.append((f"{series_title} - {season_disp}", season_id, instance_name))
+
+        # Season ID plus every episode ID written in one transaction
+        add_processed_ids("sonarr", instance_name, [season_id] + [str(eid) for eid in episode_ids])
+
+        # One read-modify-write for the whole season instead of one per
+        # episode. Per-episode history entries are deliberately not written
+        # here: the season-level entry above covers the pack, and a detail
+        # line per episode would cost a get_episode call each.
+        increment_stat_only("sonarr", "upgraded", len(episode_ids))
+        return True
+
+    with ThreadPoolExecutor(max_workers=min(4, len(seasons_to_process))) as executor:
+        futures = [executor.submit(_process_one_season, season) for season in seasons_to_process]
+        for future in as_completed(futures):
+            try:
+                if future.result():
+                    processed_any = True
+            except Exception as e:
+                sonarr_logger.error(f"Error processing season upgrade: {e}")
+
+    if series_to_tag:
+        try:
+            sonarr_api.tag_processed_series_bulk(api_url, api_key, api_timeout, sorted(series_to_tag), custom_tag)
+        except Exception as e:
+            sonarr_logger.warning(f"Failed to bulk tag {len(series_to_tag)} series with '{custom_tag}': {e}")
+
+    if history_entries:
+        log_processed_media_bulk("sonarr", history_entries, "upgrade")
 
     sonarr_logger.info("Finished quality cutoff upgrades processing cycle (season mode) for Sonarr.")
     return processed_any
@@ -275,57 +284,56 @@ def process_upgrade_episodes_mode(
     command_wait_delay: int,
     command_wait_attempts: int,
     stop_check: Callable[[], bool],
-    allowed_series_ids: Set[int]
+    allowed_series_ids: FrozenSet[int],
+    now_iso: str
 ) -> bool:
     """Process upgrades in individual episode mode (tag-gated to 'done')."""
     processed_any = False
 
     sonarr_logger.warning("Using Episodes mode for upgrades - This will make more API calls and does not support tagging")
 
+    # Tag gate pushed down into the random-page fetch
     cutoff_unmet_episodes = sonarr_api.get_cutoff_unmet_episodes_random_page(
-        api_url, api_key, api_timeout, monitored_only, hunt_upgrade_items * 2
+        api_url, api_key, api_timeout, monitored_only, hunt_upgrade_items * 2,
+        series_ids=allowed_series_ids
     )
 
-    if not cutoff_unmet_episodes:
-        sonarr_logger.info("No cutoff unmet episodes found in Sonarr for individual processing.")
-        return False
-
-    # Tag gate (done tag)
-    cutoff_unmet_episodes = [
-        ep for ep in cutoff_unmet_episodes
-        if int(ep.get("seriesId") or 0) in allowed_series_ids
-    ]
-
     if not cutoff_unmet_episodes:
         sonarr_logger.info("No cutoff unmet episodes found for series tagged 'done' (episodes mode).")
         return False
 
-    now_unix = time.time()
-    original_count = len(cutoff_unmet_episodes)
-    cutoff_unmet_episodes = [
-        ep for ep in cutoff_unmet_episodes
-        if ep.get('airDateUtc') and time.mktime(time.strptime(ep['airDateUtc'], '%Y-%m-%dT%H:%M:%SZ')) < now_unix
-    ]
-    skipped_count = original_count - len(cutoff_unmet_episodes)
-    if skipped_count > 0:
-        sonarr_logger.info(f"Skipped {skipped_count} future episodes based on air date for upgrades.")
-
     if stop_check():
         sonarr_logger.info("Stop requested during upgrade processing.")
         return processed_any
 
-    unprocessed_episodes = []
-    for episode in cutoff_unmet_episodes:
-        episode_id = str(episode.get('id'))
-        if not is_processed("sonarr", instance_name, episode_id):
-            unprocessed_episodes.append(episode)
+    # Single pass: air-date filter and processed-state dedup fused, so the
+    # sampled page is walked once (the tag gate already ran inside the
+    # random-page fetch). ISO-8601 Z timestamps sort lexicographically, so
+    # the air-date test is one string compare against the cycle's now_iso.
+    _get = dict.get
+    already_done = are_processed(
+        "sonarr", instance_name, [str(_get(ep, 'id')) for ep in cutoff_unmet_episodes]
+    )
+    unprocessed_episodes = [
+        ep for ep in cutoff_unmet_episodes
+        if (air := _get(ep, 'airDateUtc')) and air < now_iso
+        and str(_get(ep, 'id')) not in already_done
+    ]
 
     if not unprocessed_episodes:
-        sonarr_logger.info("All cutoff unmet episodes have been processed.")
+        sonarr_logger.info("No cutoff unmet episodes left after air-date and processed-state filtering.")
         return False
+    if sonarr_logger.isEnabledFor(logging.DEBUG):
+        future_count = sum(
+            1 for ep in cutoff_unmet_episodes
+            if not ((air := _get(ep, 'airDateUtc')) and air < now_iso)
+        )
+        sonarr_logger.debug(
+            "Filtered %d future and %d already-processed episodes from %d candidates",
+            future_count, len(already_done), len(cutoff_unmet_episodes)
+        )
 
-    random.shuffle(unprocessed_episodes)
-    episodes_to_process = unprocessed_episodes[:hunt_upgrade_items]
+    episodes_to_process = random.sample(unprocessed_episodes, k=min(len(unprocessed_episodes), hunt_upgrade_items))
 
     processed_count = 0
     for episode in episodes_to_process:
@@ -333,12 +341,9 @@ def process_upgrade_episodes_mode(
             sonarr_logger.info("Stop requested. Aborting episode upgrade processing.")
             break
 
-        try:
-            if check_hourly_cap_exceeded("sonarr"):
-                sonarr_logger.warning(f"🛑 Sonarr API hourly limit reached - stopping episode upgrade processing after {processed_count} episodes")
-                break
-        except Exception as e:
-            sonarr_logger.error(f"Error checking hourly API cap: {e}")
+        if check_hourly_cap_exceeded_cached("sonarr"):
+            sonarr_logger.warning(f"🛑 Sonarr API hourly limit reached - stopping episode upgrade processing after {processed_count} episodes")
+            break
 
         episode_id = episode.get('id')
         series_info = episode.get('series', {})
@@ -352,7 +357,7 @@ def process_upgrade_episodes_mode(
         except Exception:
             season_episode = f"S{season_number}E{episode_number}"
 
-        sonarr_logger.info(f"Processing upgrade for episode: {series_title} - {season_episode} - {episode_title}")
+        sonarr_logger.info("Processing upgrade for episode: %s - %s - %s", series_title, season_episode, episode_title)
 
         command_id = sonarr_api.search_episode(api_url, api_key, api_timeout, [episode_id])
         if command_id:
@@ -362,7 +367,7 @@ def process_upgrade_episodes_mode(
                     command_wait_delay, command_wait_attempts, "Episode Upgrade Search", stop_check
                 )
                 if not ok:
-                    sonarr_logger.warning(f"Episode upgrade search command for {series_title} - {season_episode} did not complete successfully")
+                    sonarr_logger.warning("Episode upgrade search command for %s - %s did not complete successfully", series_title, season_episode)
                     continue
 
             processed_any = True
@@ -375,7 +380,7 @@ def process_upgrade_episodes_mode(
 
             increment_stat("sonarr", "upgraded")
         else:
-            sonarr_logger.error(f"Failed to trigger upgrade search for episode: {series_title} - {season_episode}")
+            sonarr_logger.error("Failed to trigger upgrade search for episode: %s - %s", series_title, season_episode)
 
     sonarr_logger.info(f"Processed {processed_count} individual episode upgrades for Sonarr.")
     sonarr_logger.warning("Episodes mode upgrade processing complete - consider using Season Packs mode for better efficiency")
@@ -395,10 +400,15 @@ def wait_for_command(
         sonarr_logger.debug(f"Not waiting for command to complete (wait_delay={wait_delay}, max_attempts={max_attempts})")
         return True
 
-    sonarr_logger.debug(f"Waiting for {command_name} to complete (command ID: {command_id}). Checking every {wait_delay}s for up to {max_attempts} attempts")
+    sonarr_logger.debug(f"Waiting for {command_name} to complete (command ID: {command_id}). Polling from 0.25s up to {wait_delay}s for up to {max_attempts * wait_delay}s")
 
+    # Poll fast at first to catch quick completions, doubling the delay up
+    # to the configured wait_delay. A deadline keeps the overall timeout
+    # budget at the same max_attempts * wait_delay as the fixed-delay loop.
+    deadline = time.monotonic() + max_attempts * wait_delay
+    delay = 0.25
     attempts = 0
-    while attempts < max_attempts:
+    while time.monotonic() < deadline:
         if stop_check():
             sonarr_logger.info(f"Stopping wait for {command_name} due to stop request")
             return False
@@ -414,16 +424,27 @@ def wait_for_command(
 
         status = command_status.get('status')
         if status == 'completed':
-            sonarr_logger.debug(f"Sonarr {command_name} (ID: {command_id}) completed successfully")
+            sonarr_logger.debug("Sonarr %s (ID: %s) completed successfully", command_name, command_id)
             return True
         elif status in ['failed', 'aborted']:
-            sonarr_logger.warning(f"Sonarr {command_name} (ID: {command_id}) {status}")
+            sonarr_logger.warning("Sonarr %s (ID: %s) %s", command_name, command_id, status)
             return False
 
-        sonarr_logger.debug(f"Sonarr {command_name} (ID: {command_id}) status: {status}, attempt {attempts+1}/{max_attempts}")
+        # Formatted on every poll, so defer the work unless debug is on
+        if sonarr_logger.isEnabledFor(logging.DEBUG):
+            sonarr_logger.debug("Sonarr %s (ID: %s) status: %s, attempt %d", command_name, command_id, status, attempts + 1)
 
         attempts += 1
-        time.sleep(wait_delay)
+        # A started command usually finishes soon, so poll it tighter than
+        # one still sitting in the queue
+        if status == 'started':
+            cap = min(wait_delay, 1)
+        elif status == 'queued':
+            cap = min(wait_delay, 2)
+        else:
+            cap = wait_delay
+        time.sleep(min(delay, cap))
+        delay = min(delay * 2, wait_delay)
 
-    sonarr_logger.error(f"Sonarr command '{command_name}' (ID: {command_id}) timed out after {max_attempts} attempts.")
+    sonarr_logger.error(f"Sonarr command '{command_name}' (ID: {command_id}) timed out after {max_attempts * wait_delay}s.")
     return False
@@ -8,7 +8,7 @@ Now uses SQLite database instead of JSON files for better performance and reliab
 import time
 import datetime
 import logging
-from typing import Dict, Any, List, Optional, Set
+from typing import Dict, Any, Iterable, List, Optional, Set
 
 # Create logger for stateful_manager
 stateful_logger = logging.getLogger("stateful_manager")
@@ -314,6 +314,160 @@ def is_processed(app_type: str, instance_name: str, media_id: str) -> bool:
         stateful_logger.error(f"Error checking if processed for {app_type}/{instance_name}, ID:{media_id}: {e}")
         return False
 
+def are_processed(app_type: str, instance_name: str, media_ids: Iterable[str]) -> Set[str]:
+    """
+    Check which of the given media IDs have already been processed.
+
+    Fetches the instance's processed set once and intersects it, so deduping
+    a whole candidate list costs one database round-trip instead of one per
+    ID as repeated is_processed calls would.
+
+    Args:
+        app_type: The type of app (sonarr, radarr, etc.)
+        instance_name: The name of the instance
+        media_ids: The IDs of the media to check
+
+    Returns:
+        Set[str]: The subset of media_ids already processed (empty if state
+        management is disabled for the instance)
+    """
+    try:
+        # First check if state management is enabled for this instance
+        instance_hours = 168  # Default
+        instance_mode = "custom"
+
+        try:
+            from src.primary.settings_manager import load_settings
+            settings = load_settings(app_type)
+
+            if settings and 'instances' in settings:
+                # Find the matching instance
+                for instance in settings['instances']:
+                    if instance.get('name') == instance_name:
+                        instance_mode = instance.get('state_management_mode', 'custom')
+                        instance_hours = instance.get('state_management_hours', 168)
+
+                        # If state management is disabled for this instance, treat everything as unprocessed
+                        if instance_mode == 'disabled':
+                            stateful_logger.debug(f"State management disabled for {app_type}/{instance_name}, treating all items as unprocessed")
+                            return set()
+                        break
+        except Exception as e:
+            stateful_logger.warning(f"Could not check state management mode for {app_type}/{instance_name}: {e}")
+            # Fall back to checking anyway if we can't determine the mode
+
+        db = get_database()
+
+        # Initialize per-instance state management if not already done
+        db.initialize_instance_state_management(app_type, instance_name, instance_hours)
+
+        # Check if this instance's state has expired
+        if db.check_instance_expiration(app_type, instance_name):
+            stateful_logger.info(f"State management expired for {app_type}/{instance_name}, resetting...")
+            db.reset_instance_state_management(app_type, instance_name, instance_hours)
+            # After reset, nothing is processed
+            return set()
+
+        # Converting IDs to strings since some callers might pass integers
+        candidates = {str(media_id) for media_id in media_ids}
+        processed_ids = db.get_processed_ids(app_type, instance_name)
+        matched = processed_ids & candidates
+
+        stateful_logger.info(f"are_processed check: {app_type}/{instance_name}, Checked:{len(candidates)}, Found:{len(matched)}, Total IDs:{len(processed_ids)}")
+
+        return matched
+    except Exception as e:
+        stateful_logger.error(f"Error bulk-checking processed IDs for {app_type}/{instance_name}: {e}")
+        return set()
+
+def filter_unprocessed(app_type: str, instance_name: str, media_ids: Iterable[str]) -> List[str]:
+    """
+    Return the given media IDs that have not been processed yet, in order.
+
+    Args:
+        app_type: The type of app (sonarr, radarr, etc.)
+        instance_name: The name of the instance
+        media_ids: The IDs of the media to check
+
+    Returns:
+        List[str]: The media_ids not yet processed (all of them if state
+        management is disabled for the instance)
+    """
+    id_list = [str(media_id) for media_id in media_ids]
+    processed = are_processed(app_type, instance_name, id_list)
+    if not processed:
+        return id_list
+    return [media_id for media_id in id_list if media_id not in processed]
+
+def add_processed_ids(app_type: str, instance_name: str, media_ids: Iterable[str]) -> bool:
+    """
+    Add multiple media IDs to the processed list for a specific app instance.
+
+    Checks the instance's state management mode and expiration once and
+    writes all IDs in a single transaction, instead of repeating that work
+    per ID as looped add_processed_id calls would.
+
+    Args:
+        app_type: The type of app (sonarr, radarr, etc.)
+        instance_name: The name of the instance
+        media_ids: The IDs of the processed media
+
+    Returns:
+        bool: True if successful, False otherwise (or if state management is disabled)
+    """
+    if app_type not in APP_TYPES:
+        stateful_logger.warning(f"Unknown app type: {app_type}")
+        return False
+
+    id_list = [str(media_id) for media_id in media_ids]
+    if not id_list:
+        return True
+
+    try:
+        # First check if state management is enabled for this instance
+        instance_hours = 168  # Default
+        instance_mode = "custom"
+
+        try:
+            from src.primary.settings_manager import load_settings
+            settings = load_settings(app_type)
+
+            if settings and 'instances' in settings:
+                # Find the matching instance
+                for instance in settings['instances']:
+                    if instance.get('name') == instance_name:
+                        instance_mode = instance.get('state_management_mode', 'custom')
+                        instance_hours = instance.get('state_management_hours', 168)
+
+                        # If state management is disabled for this instance, don't add to processed list
+                        if instance_mode == 'disabled':
+                            stateful_logger.debug(f"State management disabled for {app_type}/{instance_name}, not adding {len(id_list)} items to processed list")
+                            return True  # Return True to indicate "success" (no error), but items weren't actually added
+                        break
+        except Exception as e:
+            stateful_logger.warning(f"Could not check state management mode for {app_type}/{instance_name}: {e}")
+            # Fall back to adding anyway if we can't determine the mode
+
+        db = get_database()
+
+        # Initialize per-instance state management if not already done
+        db.initialize_instance_state_management(app_type, instance_name, instance_hours)
+
+        # Check if this instance's state has expired
+        if db.check_instance_expiration(app_type, instance_name):
+            stateful_logger.info(f"State management expired for {app_type}/{instance_name}, resetting before adding new IDs...")
+            db.reset_instance_state_management(app_type, instance_name, instance_hours)
+
+        # INSERT OR IGNORE makes already-present IDs a no-op
+        success = db.add_processed_ids(app_type, instance_name, id_list)
+        if success:
+            stateful_logger.debug(f"[add_processed_ids] Added {len(id_list)} IDs to database for {app_type}/{instance_name}")
+
+        return success
+    except Exception as e:
+        stateful_logger.error(f"Error adding {len(id_list)} media IDs to database: {e}")
+        return False
+
 def get_stateful_management_info() -> Dict[str, Any]:
     """Get information about the stateful management system."""
     lock_info = get_lock_info()
@@ -8,6 +8,7 @@ Now uses SQLite database instead of JSON files for better performance and reliab
 
 import datetime
 import threading
+import time
 from typing import Dict, Any, Optional
 from src.primary.utils.logger import get_logger
 from src.primary.utils.database import get_database
@@ -305,6 +306,31 @@ def check_hourly_cap_exceeded(app_type: str) -> bool:
     status = get_hourly_cap_status(app_type)
     return status.get("exceeded", False)
 
+# The cap moves on minute scale; cache the verdict briefly so per-item hunt
+# loops and bursts of paginated requests don't re-read the stats store every
+# call. One shared cache here means every caller sees the same verdict.
+_CAP_CHECK_TTL = 5.0  # seconds
+_cap_check_cache: Dict[str, tuple] = {}  # app_type -> (checked_at, exceeded)
+
+def check_hourly_cap_exceeded_cached(app_type: str) -> bool:
+    """
+    check_hourly_cap_exceeded with the result cached for _CAP_CHECK_TTL seconds.
+
+    A check that raises is treated as not exceeded rather than blocking
+    processing.
+    """
+    cached = _cap_check_cache.get(app_type)
+    now = time.monotonic()
+    if cached and now - cached[0] < _CAP_CHECK_TTL:
+        return cached[1]
+    try:
+        exceeded = check_hourly_cap_exceeded(app_type)
+    except Exception as e:
+        logger.error(f"Error checking hourly API cap for {app_type}: {e}")
+        exceeded = False
+    _cap_check_cache[app_type] = (now, exceeded)
+    return exceeded
+
 def save_stats(stats: Dict[str, Dict[str, int]]) -> bool:
     """
     Save statistics to the database
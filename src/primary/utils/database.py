@@ -858,6 +858,22 @@ class HuntarrDatabase:
             logger.error(f"Error adding processed ID {media_id} for {app_type}/{instance_name}: {e}")
             return False
     
+    def add_processed_ids(self, app_type: str, instance_name: str, media_ids: List[str]) -> bool:
+        """Add multiple processed media IDs for a specific app instance in one transaction"""
+        try:
+            with self.get_connection() as conn:
+                conn.executemany('''
+                    INSERT OR IGNORE INTO stateful_processed_ids
+                    (app_type, instance_name, media_id)
+                    VALUES (?, ?, ?)
+                ''', [(app_type, instance_name, str(media_id)) for media_id in media_ids])
+                conn.commit()
+                logger.debug(f"Added {len(media_ids)} processed IDs for {app_type}/{instance_name}")
+                return True
+        except Exception as e:
+            logger.error(f"Error adding {len(media_ids)} processed IDs for {app_type}/{instance_name}: {e}")
+            return False
+
     def is_processed(self, app_type: str, instance_name: str, media_id: str) -> bool:
         """Check if a media ID has been processed for a specific app instance"""
         with self.get_connection() as conn:
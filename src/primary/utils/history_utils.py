@@ -62,3 +62,58 @@ def log_processed_media(app_type, media_name, media_id, instance_name, operation
     except Exception as e:
         logger.error(f"Error logging history entry: {str(e)}")
         return False
+
+def log_processed_media_bulk(app_type, entries, operation_type="missing"):
+    """
+    Log a batch of processed media in one pass
+
+    Parameters:
+    - app_type: str - The app type (sonarr, radarr, etc)
+    - entries: list - (media_name, media_id, instance_name) tuples
+    - operation_type: str - Type of operation ("missing" or "upgrade")
+
+    Returns:
+    - bool - True when every entry was logged or skipped as a duplicate
+
+    The duplicate cache is pruned and the timestamp taken once for the whole
+    batch; each entry still goes through add_history_entry so per-app
+    locking and discovery tracking behave exactly as single calls.
+    """
+    if not entries:
+        return True
+
+    current_time = time.time()
+    expired_keys = [k for k, v in _recent_log_entries.items() if current_time - v > _DUPLICATE_WINDOW_SECONDS]
+    for key in expired_keys:
+        del _recent_log_entries[key]
+
+    all_ok = True
+    logged_count = 0
+    for media_name, media_id, instance_name in entries:
+        try:
+            entry_key = f"{app_type}|{instance_name}|{media_name}|{operation_type}"
+            last_logged = _recent_log_entries.get(entry_key)
+            if last_logged is not None and current_time - last_logged < _DUPLICATE_WINDOW_SECONDS:
+                logger.debug(f"Skipping duplicate history entry for {app_type} - {instance_name}: {media_name}")
+                continue
+
+            entry_data = {
+                "name": media_name,
+                "id": str(media_id),
+                "instance_name": instance_name,
+                "operation_type": operation_type
+            }
+
+            if add_history_entry(app_type, entry_data):
+                _recent_log_entries[entry_key] = current_time
+                logged_count += 1
+            else:
+                logger.error(f"Failed to log history entry for {app_type} - {instance_name}: {media_name}")
+                all_ok = False
+        except Exception as e:
+            logger.error(f"Error logging history entry: {str(e)}")
+            all_ok = False
+
+    if logged_count:
+        logger.info(f"Logged {logged_count} history entries for {app_type} ({operation_type})")
+    return all_ok